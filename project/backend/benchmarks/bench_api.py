@@ -0,0 +1,263 @@
+"""Concurrent load benchmark for the read API at realistic archive sizes.
+
+Loads synthetic articles through Database.save_articles, then drives each
+read endpoint with concurrent requests and reports latency percentiles,
+throughput and memory. Results are written as JSON baselines that later
+runs can be compared against.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_api --backend memory --sizes 10000 100000
+    python -m benchmarks.bench_api --backend mongomock --sizes 10000
+    python -m benchmarks.bench_api --backend mongo --mongo-uri mongodb://localhost:27017
+    python -m benchmarks.bench_api --compare benchmarks/results/api-memory-10000.json
+
+By default requests go to the app in-process; pass --url to load a running
+server instead. The dataset is then loaded into the server's MongoDB, so
+--database must name the database the server reads (its DATABASE_NAME).
+
+Loading starts by clearing the articles of the target database. Databases
+whose name does not contain "bench" are only cleared with --allow-clear:
+
+    python -m benchmarks.bench_api --backend mongo --url http://localhost:8000 \
+        --database news_aggregator_bench
+"""
+from datetime import datetime
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+
+import httpx
+
+from benchmarks.synthetic import batched, synthetic_articles
+
+SCENARIOS: Dict[str, str] = {
+    "articles": "/api/articles",
+    "articles_sentiment": "/api/articles?sentiment=positive",
+    "articles_source": "/api/articles?source=CNN",
+    "articles_category": "/api/articles?category=Tech",
+    "articles_search": "/api/articles?search=election",
+    "sentiment_stats": "/api/sentiment-stats",
+    "sources": "/api/sources",
+    "categories": "/api/categories",
+    "dashboard": "/api/dashboard",
+    "trending": "/api/trending?window=day",
+    "trending_source": "/api/trending?window=day&source=CNN",
+}
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def rss_mb() -> float:
+    """Peak resident set size of this process"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def connect_backend(db, backend: str, mongo_uri: Optional[str]):
+    from config import settings
+
+    if backend == "memory":
+        db.use_in_memory()
+        return
+
+    if backend == "mongomock":
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            raise SystemExit("--backend mongomock needs: pip install -r benchmarks/requirements.txt")
+        await db.connect(AsyncMongoMockClient())
+    else:
+        import motor.motor_asyncio
+        await db.connect(motor.motor_asyncio.AsyncIOMotorClient(mongo_uri or settings.mongodb_url))
+
+    if db.backend != "mongo":
+        raise SystemExit(f"Could not connect to the {backend} backend")
+
+
+def is_bench_database(name: str) -> bool:
+    return "bench" in name.lower()
+
+
+async def load_dataset(db, size: int, batch_size: int) -> float:
+    """Insert synthetic articles through save_articles; returns articles/sec"""
+    await db.clear_articles()
+    started = time.perf_counter()
+    for batch in batched(synthetic_articles(size), batch_size):
+        await db.save_articles(batch)
+    return size / (time.perf_counter() - started)
+
+
+async def run_scenario(client: httpx.AsyncClient, path: str, concurrency: int, requests: int) -> dict:
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+async def benchmark(args, size: int) -> dict:
+    import main as api
+
+    if args.url and args.backend == "memory":
+        raise SystemExit("--url needs a MongoDB backend; the in-memory store is per process")
+
+    await connect_backend(api.db, args.backend, args.mongo_uri)
+    load_rate = await load_dataset(api.db, size, args.batch_size)
+    rss_after_load = rss_mb()
+    print(f"[{args.backend} {size:,}] loaded at {load_rate:,.0f} articles/sec, rss {rss_after_load} MB")
+
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=60)
+    else:
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=api.app), base_url="http://bench", timeout=60
+        )
+
+    cache_modes = ["off", "on"] if args.cache == "both" else [args.cache]
+    scenarios = {}
+    async with client:
+        for cache in cache_modes:
+            # A zero budget makes the response cache store nothing
+            api.response_cache.max_bytes = args.cache_bytes if cache == "on" else 0
+            api.response_cache.clear()
+            for name, path in SCENARIOS.items():
+                result = await run_scenario(client, path, args.concurrency, args.requests)
+                key = f"{name}[cache={cache}]" if not args.url else name
+                scenarios[key] = result
+                print(
+                    f"  {key:<34} p50 {result['p50_ms']:>9.2f} ms  p95 {result['p95_ms']:>9.2f} ms  "
+                    f"p99 {result['p99_ms']:>9.2f} ms  {result['throughput_rps']:>9,.1f} req/s"
+                    + (f"  errors {result['errors']}" if result["errors"] else "")
+                )
+            if args.url:
+                # The server's cache cannot be toggled from here
+                break
+
+    return {
+        "meta": {
+            "backend": args.backend,
+            "size": size,
+            "target": args.url or "in-process",
+            "concurrency": args.concurrency,
+            "requests_per_scenario": args.requests,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+        },
+        "load": {"articles_per_sec": round(load_rate, 1)},
+        "memory": {"rss_after_load_mb": rss_after_load, "peak_rss_mb": rss_mb()},
+        "scenarios": scenarios,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """Scenarios whose p95 latency grew by more than threshold (a ratio)"""
+    regressions = []
+    for name, result in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if not before or not before["p95_ms"]:
+            continue
+        ratio = result["p95_ms"] / before["p95_ms"]
+        marker = "REGRESSION" if ratio > threshold else ""
+        print(f"  {name:<34} p95 {before['p95_ms']:>9.2f} -> {result['p95_ms']:>9.2f} ms  x{ratio:.2f} {marker}")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=["memory", "mongomock", "mongo"], default="memory")
+    parser.add_argument("--mongo-uri", help="MongoDB URI for --backend mongo (defaults to MONGO_URI)")
+    parser.add_argument("--database", help="Database name used for mongo backends (default: news_aggregator_bench; required with --url)")
+    parser.add_argument("--allow-clear", action="store_true", help="Allow clearing a database whose name does not contain 'bench'")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--cache", choices=["on", "off", "both"], default="both")
+    parser.add_argument("--cache-bytes", type=int, default=32 * 1024 * 1024)
+    parser.add_argument("--url", help="Benchmark a running server instead of the app in-process")
+    parser.add_argument("--output", help="Result file (default: benchmarks/results/api-<backend>-<size>.json)")
+    parser.add_argument("--compare", help="Baseline result file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2, help="p95 ratio counted as a regression")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.url and not args.database:
+        parser.error("--url needs --database set to the database the server reads")
+    args.database = args.database or "news_aggregator_bench"
+    if args.backend != "memory" and not is_bench_database(args.database) and not args.allow_clear:
+        parser.error(f"Loading clears the articles in {args.database!r}; pass --allow-clear to do that")
+
+    from config import settings
+    settings.database_name = args.database
+    settings.run_scraper = False
+
+    if args.compare and len(args.sizes) > 1:
+        parser.error("--compare takes a single --sizes value")
+
+    failed = False
+    for size in args.sizes:
+        result = asyncio.run(benchmark(args, size))
+
+        output = args.output or os.path.join(RESULTS_DIR, f"api-{args.backend}-{size}.json")
+        if args.compare:
+            with open(args.compare) as f:
+                baseline = json.load(f)
+            print(f"Compared with {args.compare}:")
+            failed = bool(compare(baseline, result, args.threshold)) or failed
+            if os.path.abspath(output) == os.path.abspath(args.compare):
+                # Keep the baseline; write the new run next to it
+                output = output.replace(".json", ".latest.json")
+
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, "w") as f:
+            json.dump(result, f, indent=2)
+        print(f"Results written to {output}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Throughput and peak memory of the article export encoders.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_export --rows 100000
+"""
+from datetime import datetime, timedelta
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+
+from export import encode_export
+from benchmarks.synthetic import synthetic_article_dict
+
+
+async def synthetic_docs(rows: int):
+    rng = random.Random(42)
+    start = datetime.now() - timedelta(days=30)
+    for i in range(rows):
+        yield synthetic_article_dict(i, rng, start)
+
+
+async def run(rows: int, fmt: str, compress: bool):
+    tracemalloc.start()
+    started = time.perf_counter()
+    total_bytes = 0
+    async for chunk in encode_export(synthetic_docs(rows), fmt, compress):
+        total_bytes += len(chunk)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    label = f"{fmt}{'+gzip' if compress else ''}"
+    print(
+        f"{label:<12} rows={rows:<9} {rows / elapsed:>12,.0f} rows/sec "
+        f"{total_bytes / elapsed / 1e6:>8.1f} MB/s  peak={peak / 1024:,.0f} KiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for fmt in ("ndjson", "csv"):
+        for compress in (False, True):
+            asyncio.run(run(args.rows, fmt, compress))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Synthetic articles shaped like scraped ones, for benchmarks."""
+from datetime import datetime, timedelta
+from typing import Iterator, List
+import random
+
+from models import NewsArticle
+
+SOURCES = [
+    ("Times of India", "General"),
+    ("NDTV", "General"),
+    ("CNN", "Health"),
+    ("NY Times", "Tech"),
+]
+SENTIMENTS = ["positive", "negative", "neutral"]
+WORDS = (
+    "election market storm health vaccine court budget startup climate league "
+    "minister police hospital research launch growth crisis talks record rally "
+    "strike trade energy water school court flood tech phone rail airport"
+).split()
+
+
+def synthetic_article_dict(i: int, rng: random.Random, start: datetime) -> dict:
+    """One article document; deterministic for a given rng state"""
+    source, category = rng.choice(SOURCES)
+    title = " ".join(rng.choice(WORDS) for _ in range(8)).capitalize()
+    summary = " ".join(rng.choice(WORDS) for _ in range(30)).capitalize() + "."
+    score = round(rng.uniform(-1, 1), 3)
+    sentiment = "positive" if score >= 0.05 else "negative" if score <= -0.05 else "neutral"
+    stamp = start + timedelta(seconds=i * 30)
+    return {
+        "id": str(i),
+        "title": title,
+        "summary": summary,
+        "content": None,
+        "url": f"https://example.com/{source.lower().replace(' ', '-')}/{i}",
+        "source": source,
+        "author": None,
+        "published_at": stamp,
+        "sentiment": sentiment if rng.random() > 0.02 else rng.choice(SENTIMENTS),
+        "sentiment_score": score,
+        "category": category,
+        "image_url": None,
+        "read_time": 1,
+        "scraped_at": stamp,
+    }
+
+
+def synthetic_articles(count: int, seed: int = 42) -> Iterator[NewsArticle]:
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(seconds=count * 30)
+    for i in range(count):
+        doc = synthetic_article_dict(i, rng, start)
+        doc.pop("id")
+        yield NewsArticle(**doc)
+
+
+def batched(articles: Iterator[NewsArticle], size: int) -> Iterator[List[NewsArticle]]:
+    batch = []
+    for article in articles:
+        batch.append(article)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -60,8 +60,44 @@ class Settings(BaseSettings):
     ]
 
     selenium_timeout: int = 10
+    # Page load limit for one Selenium attempt; with selenium_timeout it bounds
+    # how long a source can hold the shared browser
+    selenium_page_load_timeout: int = 20
     headless_browser: bool = True
 
+    # Time budget for one source across all strategies
+    source_deadline_seconds: float = 45
+    # Consecutive failures before a source is suspended, and for how long
+    circuit_breaker_threshold: int = 3
+    circuit_breaker_cooldown_minutes: int = 30
+    circuit_breaker_max_cooldown_minutes: int = 360
+
+    # Upper bound on memory held by the read-endpoint response cache
+    response_cache_max_bytes: int = 32 * 1024 * 1024
+
+    # Live event stream: events kept for Last-Event-ID resume, per-client queue bound
+    event_history_size: int = 1000
+    event_client_buffer_size: int = 256
+    event_heartbeat_seconds: int = 15
+    # Capped collection that relays events between processes
+    event_log_max_bytes: int = 16 * 1024 * 1024
+
+    # Trending index: terms kept per filter and time bucket, and how often it is persisted
+    trending_capacity: int = 500
+    trending_snapshot_seconds: int = 60
+
+    # Multi-process deployment: only the holder of the scraper lease scrapes.
+    # Set RUN_SCRAPER=false on API replicas that should stay read-only.
+    run_scraper: bool = True
+    leader_lease_seconds: int = 60
+    # How often processes check for writes made elsewhere
+    version_poll_seconds: float = 2.0
+    # Scrape jobs are dropped this long after their last update
+    scrape_job_retention_hours: int = 24
+
+    # Expose /api/debug/profile, a sampling profiler of the event loop
+    profiler_enabled: bool = False
+
     class Config:
         env_file = ".env"
         extra = "forbid"
@@ -1,29 +1,56 @@
 import motor.motor_asyncio
-from pymongo import ASCENDING, DESCENDING
-from datetime import datetime, timedelta
-from typing import List, Optional
+import asyncio
+import functools
+from contextvars import ContextVar
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Optional
 import logging
 from bson import ObjectId
 
-from models import NewsArticle, SentimentStats, ScrapingStatus
+from models import NewsArticle, SentimentStats, SentimentType, ScrapingStatus, DashboardData, SourceState, ScrapeJob
 from config import settings
+from events import broker, MongoEventRelay
+from metrics import DB_OPERATION_SECONDS
+from trending import trending
 
 logger = logging.getLogger(__name__)
 
+# Set when a read fails and falls back to its empty default, so callers such as
+# the response cache can tell "no data" from "could not read"
+read_failed: ContextVar[bool] = ContextVar("read_failed", default=False)
+
+def timed(operation: str):
+    """Record how long a database method takes, labelled by backend"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            with DB_OPERATION_SECONDS.time(operation=operation, backend=self.backend):
+                return await func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
 class Database:
     def __init__(self):
         self.client = None
         self.db = None
         self.articles_collection = None
         self.status_collection = None
+        # Bumped on every write so read caches can tell when they are stale
+        self.version = 0
 
-    async def connect(self):
-        """Connect to MongoDB"""
+    async def connect(self, client=None):
+        """Connect to MongoDB, or to an already constructed Motor-compatible client"""
         try:
-            self.client = motor.motor_asyncio.AsyncIOMotorClient(settings.mongodb_url)
+            self.client = client or motor.motor_asyncio.AsyncIOMotorClient(settings.mongodb_url)
             self.db = self.client[settings.database_name]
             self.articles_collection = self.db.articles
             self.status_collection = self.db.scraping_status
+            self.leases_collection = self.db.leases
+            self.scrape_requests_collection = self.db.scrape_requests
+            self.scrape_jobs_collection = self.db.scrape_jobs
+            self.source_states_collection = self.db.source_states
+            self.trending_collection = self.db.trending
             
             # Create indexes
             await self.articles_collection.create_index([("url", ASCENDING)], unique=True)
@@ -31,61 +58,159 @@ class Database:
             await self.articles_collection.create_index([("sentiment", ASCENDING)])
             await self.articles_collection.create_index([("source", ASCENDING)])
             await self.articles_collection.create_index([("category", ASCENDING)])
+            await self.articles_collection.create_index([("scraped_at", ASCENDING)])
+            await self.scrape_jobs_collection.create_index([("created_at", DESCENDING)])
+            await self.scrape_jobs_collection.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+            await self.trending_collection.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+
+            await self.sync_version()
             
             logger.info("Connected to MongoDB successfully")
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
             # Fallback to in-memory storage for development
-            self.articles_data = []
-            self.use_memory = True
+            self.use_in_memory()
+            return
+
+        try:
+            # Capped collection relaying live events between processes
+            if "events" not in await self.db.list_collection_names():
+                await self.db.create_collection(
+                    "events", capped=True, size=settings.event_log_max_bytes
+                )
+            broker.relay = MongoEventRelay(self.db.events, self.status_collection, broker)
+        except Exception as e:
+            logger.warning(f"Live events will not be shared between processes: {e}")
+
+    def use_in_memory(self):
+        """Switch to the in-memory storage fallback"""
+        self.articles_data = []
+        self.status_data = {}
+        self.scrape_requests = []
+        self.scrape_jobs = {}
+        self.source_states = {}
+        self.trending_buckets = {}
+        self.trending_generation = 0
+        self.use_memory = True
+
+    @property
+    def backend(self) -> str:
+        return "memory" if hasattr(self, 'use_memory') else "mongo"
 
     async def disconnect(self):
         """Disconnect from MongoDB"""
         if self.client:
             self.client.close()
 
+    @timed("save_articles")
     async def save_articles(self, articles: List[NewsArticle]):
         """Save articles to database"""
         if not articles:
             return
-        
+
+        new_articles = []
+        sentiment_delta = {}
+
         try:
             if hasattr(self, 'use_memory'):
                 # In-memory storage fallback
                 for article in articles:
                     article.id = str(len(self.articles_data))
                     self.articles_data.append(article.dict())
+                    new_articles.append(article)
+                    self._count_sentiment(sentiment_delta, article.sentiment, 1)
                 return
             
             # MongoDB storage
             for article in articles:
                 article_dict = article.dict()
                 article_dict.pop('id', None)  # Remove id for upsert
+                new_id = ObjectId()
                 
-                await self.articles_collection.update_one(
+                previous = await self.articles_collection.find_one_and_update(
                     {"url": article.url},
-                    {"$set": article_dict},
-                    upsert=True
+                    {"$set": article_dict, "$setOnInsert": {"_id": new_id}},
+                    projection={"sentiment": 1},
+                    upsert=True,
+                    return_document=ReturnDocument.BEFORE
                 )
-            
-            # Update scraping status
-            await self.status_collection.update_one(
-                {"_id": "scraping_status"},
-                {
-                    "$set": {
-                        "last_scrape": datetime.now(),
-                        "articles_scraped": len(articles),
-                        "status": "completed"
-                    }
-                },
-                upsert=True
-            )
+
+                if previous is None:
+                    article.id = str(new_id)
+                    new_articles.append(article)
+                    self._count_sentiment(sentiment_delta, article.sentiment, 1)
+                elif previous.get('sentiment') != article.sentiment:
+                    self._count_sentiment(sentiment_delta, previous.get('sentiment'), -1)
+                    self._count_sentiment(sentiment_delta, article.sentiment, 1)
             
             logger.info(f"Saved {len(articles)} articles to database")
             
         except Exception as e:
             logger.error(f"Error saving articles: {e}")
+        finally:
+            # Only first sightings count towards trending; re-scrapes would inflate it
+            trending.add_articles(new_articles)
+            await self._bump_version()
+            await self._publish_saved(new_articles, sentiment_delta)
 
+    async def _bump_version(self):
+        """Advance the dataset version shared by every process"""
+        self.version += 1
+        if hasattr(self, 'use_memory') or self.status_collection is None:
+            return
+        try:
+            doc = await self.status_collection.find_one_and_update(
+                {"_id": "dataset_version"},
+                {"$inc": {"value": 1}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            self.version = doc["value"]
+        except Exception as e:
+            logger.error(f"Error bumping dataset version: {e}")
+
+    async def sync_version(self):
+        """Pick up writes made by other processes"""
+        if hasattr(self, 'use_memory'):
+            return
+        try:
+            doc = await self.status_collection.find_one({"_id": "dataset_version"})
+            if doc:
+                self.version = doc["value"]
+        except Exception as e:
+            logger.error(f"Error reading dataset version: {e}")
+
+    async def watch_version(self):
+        """Poll the shared dataset version so read caches notice writes from other processes"""
+        while not hasattr(self, 'use_memory'):
+            await asyncio.sleep(settings.version_poll_seconds)
+            await self.sync_version()
+
+    @staticmethod
+    def _count_sentiment(delta: dict, sentiment, amount: int):
+        if sentiment is None:
+            return
+        key = getattr(sentiment, 'value', sentiment)
+        delta[key] = delta.get(key, 0) + amount
+        delta['total'] = delta.get('total', 0) + amount
+
+    async def _publish_saved(self, new_articles: List[NewsArticle], sentiment_delta: dict):
+        """Push newly saved articles and the resulting stat changes to stream clients"""
+        for article in new_articles:
+            await broker.emit(
+                "article",
+                article.model_dump(mode="json"),
+                tags={
+                    "sentiment": SentimentType(article.sentiment).value,
+                    "source": article.source,
+                    "category": article.category
+                }
+            )
+        delta = {k: v for k, v in sentiment_delta.items() if v}
+        if delta:
+            await broker.emit("stats", {"delta": delta})
+
+    @timed("get_articles")
     async def get_articles(
         self,
         limit: int = 50,
@@ -101,17 +226,7 @@ class Database:
                 articles = self.articles_data.copy()
                 
                 # Apply filters
-                if sentiment:
-                    articles = [a for a in articles if a['sentiment'] == sentiment]
-                if source:
-                    articles = [a for a in articles if a['source'] == source]
-                if category:
-                    articles = [a for a in articles if a['category'] == category]
-                if search:
-                    search_lower = search.lower()
-                    articles = [a for a in articles if 
-                              search_lower in a['title'].lower() or 
-                              search_lower in (a.get('summary', '') or '').lower()]
+                articles = [a for a in articles if self._matches_filters(a, sentiment, source, category, search)]
                 
                 # Sort by published_at descending and limit
                 articles = sorted(articles, key=lambda x: x['published_at'], reverse=True)[:limit]
@@ -125,19 +240,7 @@ class Database:
                 return result
             
             # MongoDB query
-            query = {}
-            if sentiment:
-                query['sentiment'] = sentiment
-            if source:
-                query['source'] = source
-            if category:
-                query['category'] = category
-            if search:
-                query['$or'] = [
-                    {'title': {'$regex': search, '$options': 'i'}},
-                    {'summary': {'$regex': search, '$options': 'i'}},
-                    {'content': {'$regex': search, '$options': 'i'}}
-                ]
+            query = self._build_query(sentiment, source, category, search)
             
             cursor = self.articles_collection.find(query).sort('published_at', DESCENDING).limit(limit)
             articles = []
@@ -151,8 +254,85 @@ class Database:
             
         except Exception as e:
             logger.error(f"Error getting articles: {e}")
+            read_failed.set(True)
             return []
 
+    @staticmethod
+    def _build_query(
+        sentiment: Optional[str] = None,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> dict:
+        """Build a MongoDB filter for the article filters"""
+        query = {}
+        if sentiment:
+            query['sentiment'] = sentiment
+        if source:
+            query['source'] = source
+        if category:
+            query['category'] = category
+        if search:
+            query['$or'] = [
+                {'title': {'$regex': search, '$options': 'i'}},
+                {'summary': {'$regex': search, '$options': 'i'}},
+                {'content': {'$regex': search, '$options': 'i'}}
+            ]
+        return query
+
+    @staticmethod
+    def _matches_filters(
+        article: dict,
+        sentiment: Optional[str] = None,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> bool:
+        """In-memory equivalent of _build_query"""
+        if sentiment and article['sentiment'] != sentiment:
+            return False
+        if source and article['source'] != source:
+            return False
+        if category and article['category'] != category:
+            return False
+        if search:
+            search_lower = search.lower()
+            return (search_lower in article['title'].lower() or
+                    search_lower in (article.get('summary', '') or '').lower())
+        return True
+
+    async def iter_articles(
+        self,
+        sentiment: Optional[str] = None,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        search: Optional[str] = None,
+        since: Optional[datetime] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[dict]:
+        """Stream raw article documents in scraped_at order without materializing the result set"""
+        if hasattr(self, 'use_memory'):
+            # Walk by index so the export does not copy the whole store
+            index = 0
+            while index < len(self.articles_data):
+                article = self.articles_data[index]
+                index += 1
+                if since and article['scraped_at'] <= since:
+                    continue
+                if self._matches_filters(article, sentiment, source, category, search):
+                    yield article
+            return
+
+        query = self._build_query(sentiment, source, category, search)
+        if since:
+            query['scraped_at'] = {'$gt': since}
+
+        cursor = self.articles_collection.find(query).sort('scraped_at', ASCENDING).batch_size(batch_size)
+        async for doc in cursor:
+            doc['id'] = str(doc.pop('_id'))
+            yield doc
+
+    @timed("get_sentiment_stats")
     async def get_sentiment_stats(self) -> SentimentStats:
         """Get sentiment statistics"""
         try:
@@ -198,8 +378,10 @@ class Database:
             
         except Exception as e:
             logger.error(f"Error getting sentiment stats: {e}")
+            read_failed.set(True)
             return SentimentStats()
 
+    @timed("get_unique_sources")
     async def get_unique_sources(self) -> List[str]:
         """Get unique news sources"""
         try:
@@ -214,8 +396,10 @@ class Database:
             
         except Exception as e:
             logger.error(f"Error getting sources: {e}")
+            read_failed.set(True)
             return []
 
+    @timed("get_unique_categories")
     async def get_unique_categories(self) -> List[str]:
         """Get unique categories"""
         try:
@@ -227,18 +411,124 @@ class Database:
             
         except Exception as e:
             logger.error(f"Error getting categories: {e}")
+            read_failed.set(True)
             return []
 
+    @timed("get_dashboard")
+    async def get_dashboard(
+        self,
+        limit: int = 50,
+        sentiment: Optional[str] = None,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> DashboardData:
+        """Get articles, stats, filter options and facet counts in one pass"""
+        filters = {'sentiment': sentiment, 'source': source, 'category': category}
+
+        try:
+            if hasattr(self, 'use_memory'):
+                # In-memory storage fallback
+                stats = SentimentStats()
+                facets = {field: {} for field in filters}
+                sources, categories, matched = set(), set(), []
+
+                for article in self.articles_data:
+                    self._add_to_stats(stats, article['sentiment'])
+                    if article.get('source'):
+                        sources.add(article['source'])
+                    categories.add(article['category'])
+                    if search and not self._matches_filters(article, search=search):
+                        continue
+                    # A facet counts articles matching every filter except its own
+                    misses = [f for f, v in filters.items() if v and article[f] != v]
+                    if not misses:
+                        matched.append(article)
+                    for field in facets:
+                        if not misses or misses == [field]:
+                            value = getattr(article[field], 'value', article[field])
+                            facets[field][value] = facets[field].get(value, 0) + 1
+
+                matched = sorted(matched, key=lambda x: x['published_at'], reverse=True)[:limit]
+                return DashboardData(
+                    articles=[NewsArticle(**{**a, 'id': str(a.get('id', ''))}) for a in matched],
+                    stats=stats,
+                    sources=sorted(sources),
+                    categories=sorted(categories),
+                    facets=facets
+                )
+
+            # MongoDB: the page of articles uses the filter indexes through a plain find;
+            # one $facet aggregation, run alongside it, covers everything that is counted
+            def facet_counts(field):
+                others = {f: v for f, v in filters.items() if f != field}
+                return [
+                    {'$match': self._build_query(search=search, **others)},
+                    {'$group': {'_id': f'${field}', 'count': {'$sum': 1}}}
+                ]
+
+            pipeline = [{
+                '$facet': {
+                    'stats': [{'$group': {'_id': '$sentiment', 'count': {'$sum': 1}}}],
+                    'sources': [{'$group': {'_id': '$source'}}],
+                    'categories': [{'$group': {'_id': '$category'}}],
+                    'sentiment_counts': facet_counts('sentiment'),
+                    'source_counts': facet_counts('source'),
+                    'category_counts': facet_counts('category')
+                }
+            }]
+
+            query = self._build_query(sentiment, source, category, search)
+            cursor = self.articles_collection.find(query).sort('published_at', DESCENDING).limit(limit)
+            docs, results = await asyncio.gather(
+                cursor.to_list(length=limit),
+                self.articles_collection.aggregate(pipeline).to_list(length=1)
+            )
+            if not results:
+                return DashboardData()
+            result = results[0]
+
+            articles = []
+            for doc in docs:
+                doc['id'] = str(doc.pop('_id'))
+                articles.append(NewsArticle(**doc))
+
+            stats = SentimentStats()
+            for doc in result['stats']:
+                self._add_to_stats(stats, doc['_id'], doc['count'])
+
+            return DashboardData(
+                articles=articles,
+                stats=stats,
+                sources=sorted(doc['_id'] for doc in result['sources'] if doc['_id']),
+                categories=sorted(doc['_id'] for doc in result['categories'] if doc['_id']),
+                facets={
+                    field: {doc['_id']: doc['count'] for doc in result[f'{field}_counts'] if doc['_id']}
+                    for field in filters
+                }
+            )
+
+        except Exception as e:
+            logger.error(f"Error getting dashboard: {e}")
+            read_failed.set(True)
+            return DashboardData()
+
+    @staticmethod
+    def _add_to_stats(stats: SentimentStats, sentiment, count: int = 1):
+        if sentiment == 'positive':
+            stats.positive += count
+        elif sentiment == 'negative':
+            stats.negative += count
+        elif sentiment == 'neutral':
+            stats.neutral += count
+        stats.total += count
+
+    @timed("get_scraping_status")
     async def get_scraping_status(self) -> ScrapingStatus:
         """Get scraping status"""
         try:
             if hasattr(self, 'use_memory'):
-                return ScrapingStatus(
-                    last_scrape=datetime.now() - timedelta(minutes=5),
-                    articles_scraped=len(self.articles_data),
-                    sources_active=4,
-                    status="completed"
-                )
+                return ScrapingStatus(**self.status_data)
             
             doc = await self.status_collection.find_one({"_id": "scraping_status"})
             if doc:
@@ -251,15 +541,281 @@ class Database:
             logger.error(f"Error getting scraping status: {e}")
             return ScrapingStatus()
 
+    async def update_scraping_status(self, **fields):
+        """Update fields of the scraping status"""
+        try:
+            if hasattr(self, 'use_memory'):
+                self.status_data.update(fields)
+                return
+
+            await self.status_collection.update_one(
+                {"_id": "scraping_status"},
+                {"$set": fields},
+                upsert=True
+            )
+
+        except Exception as e:
+            logger.error(f"Error updating scraping status: {e}")
+
+    @timed("get_source_states")
+    async def get_source_states(self) -> List[SourceState]:
+        """Get per-source scraping strategy and circuit breaker state"""
+        try:
+            if hasattr(self, 'use_memory'):
+                return [SourceState(**doc) for doc in self.source_states.values()]
+
+            states = []
+            async for doc in self.source_states_collection.find({}):
+                doc['name'] = doc.pop('_id')
+                states.append(SourceState(**doc))
+            return states
+
+        except Exception as e:
+            logger.error(f"Error getting source states: {e}")
+            return []
+
+    async def save_source_state(self, state: SourceState):
+        """Persist one source's state so it survives restarts"""
+        try:
+            if hasattr(self, 'use_memory'):
+                self.source_states[state.name] = state.dict()
+                return
+
+            doc = state.dict()
+            name = doc.pop('name')
+            await self.source_states_collection.update_one(
+                {"_id": name}, {"$set": doc}, upsert=True
+            )
+
+        except Exception as e:
+            logger.error(f"Error saving source state: {e}")
+
+    async def save_trending_buckets(self, docs: List[dict]):
+        """Persist trending index buckets changed since the last snapshot"""
+        try:
+            if hasattr(self, 'use_memory'):
+                for doc in docs:
+                    self.trending_buckets[doc["_id"]] = doc
+                return
+
+            for doc in docs:
+                await self.trending_collection.replace_one({"_id": doc["_id"]}, doc, upsert=True)
+
+        except Exception as e:
+            logger.error(f"Error saving trending snapshot: {e}")
+
+    async def load_trending_buckets(self) -> List[dict]:
+        """Trending index buckets that have not expired yet"""
+        try:
+            now = datetime.now(timezone.utc)
+            if hasattr(self, 'use_memory'):
+                return [doc for doc in self.trending_buckets.values() if doc["expires_at"] > now]
+
+            return await self.trending_collection.find({"expires_at": {"$gt": now}}).to_list(length=None)
+
+        except Exception as e:
+            logger.error(f"Error loading trending snapshot: {e}")
+            return []
+
+    async def clear_trending_buckets(self):
+        """Drop every persisted trending bucket"""
+        try:
+            if hasattr(self, 'use_memory'):
+                self.trending_buckets.clear()
+                return
+
+            await self.trending_collection.delete_many({})
+
+        except Exception as e:
+            logger.error(f"Error clearing trending snapshot: {e}")
+
+    async def get_trending_generation(self) -> int:
+        """Bumped whenever articles are cleared, so every process can reset its trending index"""
+        try:
+            if hasattr(self, 'use_memory'):
+                return self.trending_generation
+
+            doc = await self.status_collection.find_one({"_id": "trending_generation"})
+            return doc["value"] if doc else 0
+
+        except Exception as e:
+            logger.error(f"Error reading trending generation: {e}")
+            return 0
+
+    async def queue_scrape_request(self, sources: Optional[List[str]] = None, job_id: Optional[str] = None):
+        """Hand a scrape trigger to whichever process holds the scraper lease"""
+        try:
+            if hasattr(self, 'use_memory'):
+                self.scrape_requests.append({"sources": sources, "job_id": job_id})
+                return
+
+            await self.scrape_requests_collection.insert_one(
+                {"sources": sources, "job_id": job_id, "requested_at": datetime.now()}
+            )
+
+        except Exception as e:
+            logger.error(f"Error queueing scrape request: {e}")
+
+    async def pop_scrape_request(self) -> Optional[dict]:
+        """Take the oldest forwarded scrape trigger, if any"""
+        try:
+            if hasattr(self, 'use_memory'):
+                return self.scrape_requests.pop(0) if self.scrape_requests else None
+
+            return await self.scrape_requests_collection.find_one_and_delete(
+                {}, sort=[("_id", ASCENDING)]
+            )
+
+        except Exception as e:
+            logger.error(f"Error reading scrape requests: {e}")
+            return None
+
+    async def save_scrape_job(self, job: ScrapeJob):
+        """Share a scrape job's progress with every process"""
+        try:
+            doc = job.dict()
+            job_id = doc.pop('id')
+            doc['expires_at'] = self._scrape_job_expiry()
+            if hasattr(self, 'use_memory'):
+                doc['cancel_requested'] = self.scrape_jobs.get(job_id, {}).get('cancel_requested', False)
+                self.scrape_jobs[job_id] = doc
+                self._expire_scrape_jobs()
+                return
+
+            await self.scrape_jobs_collection.update_one({"_id": job_id}, {"$set": doc}, upsert=True)
+
+        except Exception as e:
+            logger.error(f"Error saving scrape job: {e}")
+
+    async def alias_scrape_job(self, job_id: str, target_id: str):
+        """Point a forwarded trigger's job id at the job that ended up serving it"""
+        try:
+            alias = {"alias_of": target_id, "expires_at": self._scrape_job_expiry()}
+            if hasattr(self, 'use_memory'):
+                self.scrape_jobs[job_id] = alias
+                self._expire_scrape_jobs()
+                return
+
+            await self.scrape_jobs_collection.replace_one({"_id": job_id}, alias, upsert=True)
+
+        except Exception as e:
+            logger.error(f"Error aliasing scrape job: {e}")
+
+    @staticmethod
+    def _scrape_job_expiry() -> datetime:
+        # UTC, as the TTL monitor compares; every update pushes it back, so active jobs stay
+        return datetime.now(timezone.utc) + timedelta(hours=settings.scrape_job_retention_hours)
+
+    def _expire_scrape_jobs(self):
+        """The in-memory counterpart of the scrape_jobs TTL index"""
+        now = datetime.now(timezone.utc)
+        for job_id in [job_id for job_id, doc in self.scrape_jobs.items() if doc['expires_at'] <= now]:
+            del self.scrape_jobs[job_id]
+
+    async def _find_scrape_job(self, job_id: str) -> Optional[dict]:
+        if hasattr(self, 'use_memory'):
+            doc = self.scrape_jobs.get(job_id)
+            if doc and doc.get('alias_of'):
+                job_id, doc = doc['alias_of'], self.scrape_jobs.get(doc['alias_of'])
+            return {**doc, "_id": job_id} if doc else None
+
+        doc = await self.scrape_jobs_collection.find_one({"_id": job_id})
+        if doc and doc.get('alias_of'):
+            doc = await self.scrape_jobs_collection.find_one({"_id": doc['alias_of']})
+        return doc
+
+    @staticmethod
+    def _scrape_job(doc: dict) -> ScrapeJob:
+        doc = dict(doc)
+        doc['id'] = doc.pop('_id')
+        doc.pop('cancel_requested', None)
+        doc.pop('expires_at', None)
+        return ScrapeJob(**doc)
+
+    async def get_scrape_job(self, job_id: str) -> Optional[ScrapeJob]:
+        """Get a scrape job by id, following forwarded-trigger aliases"""
+        try:
+            doc = await self._find_scrape_job(job_id)
+            return self._scrape_job(doc) if doc else None
+
+        except Exception as e:
+            logger.error(f"Error getting scrape job: {e}")
+            return None
+
+    async def list_scrape_jobs(self, limit: int = 50) -> List[ScrapeJob]:
+        """Most recent scrape jobs, newest first"""
+        try:
+            if hasattr(self, 'use_memory'):
+                docs = [
+                    {**doc, "_id": job_id} for job_id, doc in self.scrape_jobs.items()
+                    if not doc.get('alias_of')
+                ]
+                docs.sort(key=lambda doc: doc['created_at'], reverse=True)
+                return [self._scrape_job(doc) for doc in docs[:limit]]
+
+            cursor = self.scrape_jobs_collection.find(
+                {"alias_of": {"$exists": False}}
+            ).sort("created_at", DESCENDING).limit(limit)
+            return [self._scrape_job(doc) async for doc in cursor]
+
+        except Exception as e:
+            logger.error(f"Error listing scrape jobs: {e}")
+            return []
+
+    async def request_scrape_job_cancel(self, job_id: str):
+        """Ask the process running a job to cancel it"""
+        try:
+            if hasattr(self, 'use_memory'):
+                if job_id in self.scrape_jobs:
+                    self.scrape_jobs[job_id]['cancel_requested'] = True
+                return
+
+            await self.scrape_jobs_collection.update_one(
+                {"_id": job_id}, {"$set": {"cancel_requested": True}}
+            )
+
+        except Exception as e:
+            logger.error(f"Error requesting scrape job cancellation: {e}")
+
+    async def get_cancel_requests(self, job_ids: List[str]) -> List[str]:
+        """Which of the given jobs another process asked to cancel"""
+        try:
+            if hasattr(self, 'use_memory'):
+                return [
+                    job_id for job_id in job_ids
+                    if self.scrape_jobs.get(job_id, {}).get('cancel_requested')
+                ]
+
+            cursor = self.scrape_jobs_collection.find(
+                {"_id": {"$in": job_ids}, "cancel_requested": True}, projection={"_id": 1}
+            )
+            return [doc["_id"] async for doc in cursor]
+
+        except Exception as e:
+            logger.error(f"Error reading scrape job cancellations: {e}")
+            return []
+
+    @timed("clear_articles")
     async def clear_articles(self):
         """Clear all articles"""
         try:
+            trending.clear()
             if hasattr(self, 'use_memory'):
                 self.articles_data.clear()
+                self.trending_buckets.clear()
+                self.trending_generation += 1
                 return
             
             await self.articles_collection.delete_many({})
+            # Bump before deleting, so the lease holder drops anything it writes back meanwhile
+            await self.status_collection.update_one(
+                {"_id": "trending_generation"}, {"$inc": {"value": 1}}, upsert=True
+            )
+            await self.trending_collection.delete_many({})
             logger.info("Cleared all articles from database")
             
         except Exception as e:
-            logger.error(f"Error clearing articles: {e}")
\ No newline at end of file
+            logger.error(f"Error clearing articles: {e}")
+        finally:
+            await self._bump_version()
+            await broker.emit("cleared", {})
\ No newline at end of file
@@ -0,0 +1,192 @@
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set
+import asyncio
+import json
+import logging
+
+from pymongo import CursorType, ReturnDocument
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Recently relayed event ids remembered to resume a tail without gaps or repeats
+RESUME_WINDOW = 1000
+
+
+@dataclass
+class Event:
+    id: int
+    type: str
+    data: Dict[str, Any]
+    # Article attributes the event can be filtered on; empty means "deliver to everyone"
+    tags: Dict[str, str] = field(default_factory=dict)
+
+    def encode(self) -> str:
+        """Render the event in text/event-stream format"""
+        return f"id: {self.id}\nevent: {self.type}\ndata: {json.dumps(self.data, separators=(',', ':'))}\n\n"
+
+
+class Subscriber:
+    def __init__(self, filters: Dict[str, str], buffer_size: int):
+        self.filters = {k: v for k, v in filters.items() if v}
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.overflowed = False
+
+    def wants(self, event: Event) -> bool:
+        return all(event.tags.get(k, v) == v for k, v in self.filters.items())
+
+    def offer(self, event: Event):
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Stop buffering for a client that cannot keep up; it gets a reset instead
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(Event(id=event.id, type="reset", data={}))
+
+    async def next_event(self, timeout: float) -> Optional[Event]:
+        """Wait for the next event, or None if nothing arrived within timeout"""
+        try:
+            event = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        if event.type == "reset":
+            self.overflowed = False
+        return event
+
+
+class EventBroker:
+    """Fan-out of ingest events to connected stream clients.
+
+    Keeps a bounded history so reconnecting clients can resume from their
+    last event id; clients that fall further behind are told to reset.
+    """
+
+    def __init__(self, history_size: int, client_buffer_size: int):
+        self.history: Deque[Event] = deque(maxlen=history_size)
+        self.client_buffer_size = client_buffer_size
+        self.subscribers: Set[Subscriber] = set()
+        self.last_id = 0
+        self.relay: Optional["MongoEventRelay"] = None
+
+    def publish(
+        self,
+        event_type: str,
+        data: Dict[str, Any],
+        tags: Optional[Dict[str, str]] = None,
+        event_id: Optional[int] = None
+    ) -> Event:
+        """Deliver an event locally; relayed events keep the id they were given"""
+        if event_id is None:
+            event_id = self.last_id + 1
+        self.last_id = max(self.last_id, event_id)
+        event = Event(id=event_id, type=event_type, data=data, tags=tags or {})
+        self.history.append(event)
+        for subscriber in self.subscribers:
+            if subscriber.wants(event):
+                subscriber.offer(event)
+        return event
+
+    async def emit(self, event_type: str, data: Dict[str, Any], tags: Optional[Dict[str, str]] = None):
+        """Publish an event to the clients of every API process"""
+        if self.relay:
+            try:
+                # Delivered back to this process by the relay's tail
+                await self.relay.emit(event_type, data, tags)
+                return
+            except Exception as e:
+                logger.error(f"Error relaying event: {e}")
+        self.publish(event_type, data, tags)
+
+    def subscribe(self, filters: Dict[str, str]) -> Subscriber:
+        subscriber = Subscriber(filters, self.client_buffer_size)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self.subscribers.discard(subscriber)
+
+    def replay(self, subscriber: Subscriber, last_event_id: int) -> Optional[List[Event]]:
+        """Events after last_event_id for this subscriber, or None if they are no longer buffered"""
+        if last_event_id >= self.last_id:
+            return []
+        if not self.history or self.history[0].id > last_event_id + 1:
+            return None
+        return [e for e in self.history if e.id > last_event_id and subscriber.wants(e)]
+
+    def reset_event(self) -> Event:
+        """Tell a client its view is out of date and it should refetch"""
+        return Event(id=self.last_id, type="reset", data={})
+
+
+class MongoEventRelay:
+    """Shares events between processes through a capped MongoDB collection.
+
+    Writers insert events; every API process tails the collection and
+    republishes what it reads to its own stream clients. Event ids come from
+    a counter shared by all processes, so a client can resume with its
+    Last-Event-ID on any of them.
+    """
+
+    def __init__(self, collection, counters, broker: EventBroker):
+        self.collection = collection
+        self.counters = counters
+        self.broker = broker
+        # Take an id and insert in one step, so this process's events land in id order
+        self.emit_lock = asyncio.Lock()
+
+    async def emit(self, event_type: str, data: Dict[str, Any], tags: Optional[Dict[str, str]] = None):
+        async with self.emit_lock:
+            counter = await self.counters.find_one_and_update(
+                {"_id": "event_seq"},
+                {"$inc": {"value": 1}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            await self.collection.insert_one(
+                {"_id": counter["value"], "type": event_type, "data": data, "tags": tags or {}}
+            )
+
+    async def run(self):
+        """Tail the event collection, starting after the newest existing event"""
+        last = await self.collection.find_one(sort=[("$natural", -1)])
+        last_id = last["_id"] if last and isinstance(last["_id"], int) else None
+        if last_id:
+            # Clients resuming from before this process started must get a reset, not silence
+            self.broker.last_id = max(self.broker.last_id, last_id)
+
+        seen: "OrderedDict[int, None]" = OrderedDict()
+        while True:
+            try:
+                # Writers in different processes can still insert slightly out of id
+                # order, so resume from below the recently seen ids and skip repeats
+                start = min(seen) - 1 if seen else last_id
+                query = {"_id": {"$gt": start}} if start else {}
+                cursor = self.collection.find(query, cursor_type=CursorType.TAILABLE_AWAIT)
+                while cursor.alive:
+                    async for doc in cursor:
+                        event_id = doc["_id"]
+                        if event_id in seen:
+                            continue
+                        seen[event_id] = None
+                        if len(seen) > RESUME_WINDOW:
+                            seen.popitem(last=False)
+                        self.broker.publish(doc["type"], doc["data"], doc.get("tags"), event_id=event_id)
+                    await asyncio.sleep(0.5)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error tailing events: {e}")
+            # Tailable cursors die on an empty collection; retry shortly
+            await asyncio.sleep(1)
+
+
+broker = EventBroker(
+    history_size=settings.event_history_size,
+    client_buffer_size=settings.event_client_buffer_size
+)
@@ -0,0 +1,76 @@
+from typing import AsyncIterator, Dict, List
+import csv
+import io
+import logging
+import zlib
+
+import orjson
+
+from models import NewsArticle
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FIELDS: List[str] = list(NewsArticle.model_fields.keys())
+
+MEDIA_TYPES: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Flush encoded rows in chunks of roughly this many bytes
+CHUNK_SIZE = 64 * 1024
+
+
+def _export_row(doc: dict) -> dict:
+    return {field: doc.get(field) for field in EXPORT_FIELDS}
+
+
+async def ndjson_chunks(docs: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    """Encode article documents as newline-delimited JSON"""
+    buffer = bytearray()
+    async for doc in docs:
+        buffer += orjson.dumps(_export_row(doc), option=orjson.OPT_APPEND_NEWLINE)
+        if len(buffer) >= CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def csv_chunks(docs: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    """Encode article documents as CSV with a header row"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    async for doc in docs:
+        row = []
+        for field in EXPORT_FIELDS:
+            value = doc.get(field)
+            if hasattr(value, "isoformat"):
+                value = value.isoformat()
+            elif hasattr(value, "value"):
+                value = value.value
+            row.append(value)
+        writer.writerow(row)
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Gzip a chunk stream incrementally"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def encode_export(docs: AsyncIterator[dict], fmt: str, compress: bool = False) -> AsyncIterator[bytes]:
+    """Build the byte stream for an export in the requested format"""
+    chunks = ndjson_chunks(docs) if fmt == "ndjson" else csv_chunks(docs)
+    return gzip_chunks(chunks) if compress else chunks
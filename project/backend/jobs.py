@@ -0,0 +1,256 @@
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional
+import asyncio
+import logging
+import uuid
+
+from models import ScrapeJob, SourceProgress, SourceConfig
+from events import broker
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs kept around for status lookups
+JOB_HISTORY_SIZE = 50
+
+
+class ScrapeCoordinator:
+    """Runs at most one scrape at a time.
+
+    Triggers that arrive while a run covers the requested sources join that
+    run; anything else is merged into a single queued job that starts when
+    the current one finishes.
+    """
+
+    def __init__(self, scraper, sentiment_analyzer, db):
+        self.scraper = scraper
+        self.sentiment_analyzer = sentiment_analyzer
+        self.db = db
+        self.jobs: "OrderedDict[str, ScrapeJob]" = OrderedDict()
+        self.running: Optional[ScrapeJob] = None
+        self.queued: Optional[ScrapeJob] = None
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.done: Dict[str, asyncio.Event] = {}
+        # Set while stop() runs, so finishing jobs do not promote the queued one
+        self.stopping = False
+
+    @staticmethod
+    def source_configs(names: List[str]) -> List[SourceConfig]:
+        return [source for source in settings.news_sources if source.name in names]
+
+    @staticmethod
+    def requested_sources(sources: Optional[List[str]] = None) -> List[str]:
+        """The sources a trigger asks for (all by default); raises ValueError for unknown ones"""
+        known = [source.name for source in settings.news_sources]
+        requested = sources or known
+        unknown = [name for name in requested if name not in known]
+        if unknown:
+            raise ValueError(f"Unknown sources: {', '.join(unknown)}")
+        return requested
+
+    @staticmethod
+    def new_job(sources: List[str], job_id: Optional[str] = None) -> ScrapeJob:
+        return ScrapeJob(
+            id=job_id or uuid.uuid4().hex,
+            sources=list(sources),
+            progress={name: SourceProgress() for name in sources}
+        )
+
+    async def submit(self, sources: Optional[List[str]] = None, job_id: Optional[str] = None) -> ScrapeJob:
+        """Request a scrape of the given sources (all by default) and return the job serving it.
+
+        job_id is the id already handed out for a forwarded trigger; if the
+        trigger joins an existing job, that id is made to point at it.
+        """
+        requested = self.requested_sources(sources)
+
+        if self.running and set(requested) <= set(self.running.sources):
+            self.running.requests += 1
+            return await self._joined(self.running, job_id)
+
+        if self.queued:
+            for name in requested:
+                if name not in self.queued.sources:
+                    self.queued.sources.append(name)
+                    self.queued.progress[name] = SourceProgress()
+            self.queued.requests += 1
+            await self._publish(self.queued)
+            return await self._joined(self.queued, job_id)
+
+        job = self.new_job(requested, job_id)
+        self._remember(job)
+        if self.running:
+            self.queued = job
+            await self._publish(job)
+        else:
+            self._start(job)
+        return job
+
+    async def forward(self, sources: Optional[List[str]] = None) -> ScrapeJob:
+        """Record a job for a trigger handed to the process holding the scraper lease"""
+        job = self.new_job(self.requested_sources(sources))
+        await self.db.save_scrape_job(job)
+        await self.db.queue_scrape_request(sources, job.id)
+        return job
+
+    async def stop(self):
+        """Cancel queued and running work without starting anything else, e.g. when the scraper lease is lost"""
+        self.stopping = True
+        try:
+            if self.queued:
+                queued, self.queued = self.queued, None
+                await self._finish(queued, "cancelled")
+            if self.running:
+                await self.cancel(self.running.id)
+            # Anything queued while the running job wound down is dropped too
+            if self.queued:
+                queued, self.queued = self.queued, None
+                await self._finish(queued, "cancelled")
+        finally:
+            self.stopping = False
+
+    async def apply_cancel_requests(self):
+        """Cancel local jobs that another process asked to cancel"""
+        active = [job.id for job in (self.running, self.queued) if job]
+        if not active:
+            return
+        for job_id in await self.db.get_cancel_requests(active):
+            logger.info(f"Scrape job {job_id} cancelled from another process")
+            await self.cancel(job_id)
+
+    async def _joined(self, job: ScrapeJob, job_id: Optional[str]) -> ScrapeJob:
+        if job_id and job_id != job.id:
+            await self.db.alias_scrape_job(job_id, job.id)
+        return job
+
+    def get(self, job_id: str) -> Optional[ScrapeJob]:
+        return self.jobs.get(job_id)
+
+    async def wait(self, job: ScrapeJob) -> ScrapeJob:
+        """Wait for a job to finish"""
+        await self.done[job.id].wait()
+        return job
+
+    async def cancel(self, job_id: str) -> Optional[ScrapeJob]:
+        """Cancel a queued or running job"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+
+        if job is self.queued:
+            self.queued = None
+            await self._finish(job, "cancelled")
+        elif job is self.running:
+            task = self.tasks.get(job.id)
+            if task:
+                task.cancel()
+                await self.done[job.id].wait()
+        return job
+
+    def _remember(self, job: ScrapeJob):
+        self.jobs[job.id] = job
+        self.done[job.id] = asyncio.Event()
+        while len(self.jobs) > JOB_HISTORY_SIZE:
+            old_id, old_job = next(iter(self.jobs.items()))
+            if old_job is self.running or old_job is self.queued:
+                break
+            self.jobs.pop(old_id)
+            self.done.pop(old_id, None)
+
+    def _start(self, job: ScrapeJob):
+        self.running = job
+        job.status = "running"
+        job.started_at = datetime.now()
+        self.tasks[job.id] = asyncio.create_task(self._run(job))
+
+    async def _publish(self, job: ScrapeJob):
+        await self.db.save_scrape_job(job)
+        await broker.emit("scrape_status", {
+            "job_id": job.id,
+            "status": job.status,
+            "articles_scraped": job.articles_scraped,
+            "progress": {name: p.model_dump() for name, p in job.progress.items()}
+        })
+
+    async def _run(self, job: ScrapeJob):
+        await self._publish(job)
+        logger.info(f"Scrape job {job.id} started for {', '.join(job.sources)}")
+
+        try:
+            await self.db.update_scraping_status(status="running", job_id=job.id)
+            # Another process may have scraped since; start from the shared view
+            self.scraper.load_states(await self.db.get_source_states())
+            await asyncio.gather(*(
+                self._scrape_source(job, source) for source in self.source_configs(job.sources)
+            ))
+            failed = all(p.status in ("failed", "skipped") for p in job.progress.values())
+            await self._finish(job, "failed" if failed else "completed")
+        except asyncio.CancelledError:
+            await self._finish(job, "cancelled")
+        except Exception as e:
+            logger.error(f"Scrape job {job.id} failed: {e}")
+            await self._finish(job, "failed")
+
+    async def _scrape_source(self, job: ScrapeJob, source: SourceConfig):
+        progress = job.progress[source.name]
+        if self.scraper.is_suspended(source.name):
+            progress.status = "skipped"
+            progress.error = self.scraper.source_state(source.name).last_error
+            await self._publish(job)
+            return
+
+        progress.status = "running"
+        try:
+            articles = await self.scraper.scrape_source(source)
+            await self.db.save_source_state(self.scraper.source_state(source.name))
+            if not articles:
+                progress.status = "failed"
+                progress.error = self.scraper.source_state(source.name).last_error
+                await self._publish(job)
+                return
+
+            for article in articles:
+                sentiment_data = self.sentiment_analyzer.analyze(article.content or article.summary)
+                article.sentiment = sentiment_data['sentiment']
+                article.sentiment_score = sentiment_data['score']
+
+            await self.db.save_articles(articles)
+            progress.articles = len(articles)
+            progress.status = "completed"
+            job.articles_scraped += len(articles)
+        except asyncio.CancelledError:
+            progress.status = "cancelled"
+            raise
+        except Exception as e:
+            logger.error(f"Scrape job {job.id}: {source.name} failed: {e}")
+            progress.status = "failed"
+            progress.error = str(e)
+        await self._publish(job)
+
+    async def _finish(self, job: ScrapeJob, status: str):
+        job.status = status
+        job.finished_at = datetime.now()
+        if status == "cancelled":
+            for progress in job.progress.values():
+                if progress.status in ("pending", "running"):
+                    progress.status = "cancelled"
+
+        if job is self.running:
+            self.running = None
+            self.tasks.pop(job.id, None)
+            await self.db.update_scraping_status(
+                status=status,
+                job_id=job.id,
+                last_scrape=job.finished_at,
+                articles_scraped=job.articles_scraped,
+                sources_active=sum(1 for p in job.progress.values() if p.articles)
+            )
+            logger.info(f"Scrape job {job.id} {status}: {job.articles_scraped} articles")
+
+        await self._publish(job)
+        self.done[job.id].set()
+
+        if self.running is None and self.queued and not self.stopping:
+            queued, self.queued = self.queued, None
+            self._start(queued)
@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
+import logging
+import os
+import socket
+import uuid
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+
+class MongoLease:
+    """Named, expiring lease stored in MongoDB"""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def acquire(self, name: str, owner: str, ttl_seconds: float) -> bool:
+        """Take or renew the lease; fails while another owner holds an unexpired one"""
+        now = datetime.utcnow()
+        try:
+            doc = await self.collection.find_one_and_update(
+                {"_id": name, "$or": [{"owner": owner}, {"expires_at": {"$lte": now}}]},
+                {"$set": {"owner": owner, "expires_at": now + timedelta(seconds=ttl_seconds)}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            # Lease document exists and belongs to someone else
+            return False
+        return doc is not None and doc.get("owner") == owner
+
+    async def release(self, name: str, owner: str):
+        await self.collection.delete_one({"_id": name, "owner": owner})
+
+
+class LocalLease:
+    """In-process stand-in for MongoLease, used by the in-memory backend and tests"""
+
+    def __init__(self):
+        self.holders: Dict[str, Tuple[str, datetime]] = {}
+
+    async def acquire(self, name: str, owner: str, ttl_seconds: float) -> bool:
+        now = datetime.utcnow()
+        holder = self.holders.get(name)
+        if holder and holder[0] != owner and holder[1] > now:
+            return False
+        self.holders[name] = (owner, now + timedelta(seconds=ttl_seconds))
+        return True
+
+    async def release(self, name: str, owner: str):
+        holder = self.holders.get(name)
+        if holder and holder[0] == owner:
+            del self.holders[name]
+
+
+def lease_for(db):
+    """Pick the lease store matching the database backend"""
+    if hasattr(db, 'use_memory'):
+        return LocalLease()
+    return MongoLease(db.leases_collection)
+
+
+class LeaderElector:
+    """Runs a coroutine only while this process holds a lease.
+
+    The lease is renewed every third of its lifetime. If the holder dies its
+    lease expires and another process takes over; a holder that fails to
+    renew stops its work.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self.task: Optional[asyncio.Task] = None
+
+    async def run(self, lease, work: Callable[[], Awaitable]):
+        try:
+            while True:
+                try:
+                    held = await lease.acquire(self.name, self.owner, self.ttl_seconds)
+                except Exception as e:
+                    logger.error(f"Error renewing {self.name} lease: {e}")
+                    held = False
+
+                if held and (not self.is_leader or self.task.done()):
+                    logger.info(f"{self.owner} is now {self.name} leader")
+                    self.is_leader = True
+                    self.task = asyncio.create_task(work())
+                elif not held and self.is_leader:
+                    logger.warning(f"{self.owner} lost the {self.name} lease")
+                    await self._stop()
+
+                await asyncio.sleep(self.ttl_seconds / 3)
+        finally:
+            await self._stop()
+            try:
+                await lease.release(self.name, self.owner)
+            except Exception as e:
+                logger.error(f"Error releasing {self.name} lease: {e}")
+
+    async def _stop(self):
+        self.is_leader = False
+        if self.task:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
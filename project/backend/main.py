@@ -1,13 +1,26 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 import asyncio
+import json
 import logging
+import threading
 
-from database import Database
+from cache import ResponseCache, etag_matches
+from database import Database, read_failed
+from events import broker
+from export import MEDIA_TYPES, encode_export
+from jobs import ScrapeCoordinator
+from leader import LeaderElector, lease_for
+from metrics import Gauge, MetricsMiddleware, SamplingProfiler, render_metrics
 from scraper import NewsScraper
 from sentiment_analyzer import SentimentAnalyzer
-from models import NewsArticle, SentimentStats, ScrapingStatus
+from trending import WINDOWS, trending
+from models import NewsArticle, SentimentStats, ScrapingStatus, DashboardData, ScrapeJob, SourceState, TrendingTerms
 from config import settings
 
 # Setup logging
@@ -18,15 +31,27 @@ logger = logging.getLogger(__name__)
 db = Database()
 scraper = NewsScraper()
 sentiment_analyzer = SentimentAnalyzer()
+response_cache = ResponseCache(max_bytes=settings.response_cache_max_bytes)
+coordinator = ScrapeCoordinator(scraper, sentiment_analyzer, db)
+elector = LeaderElector("scraper", settings.leader_lease_seconds)
 
 # App lifespan handler
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting News Aggregator API...")
     await db.connect()
-    asyncio.create_task(periodic_scraping())
+    trending.restore(await db.load_trending_buckets())
+    background = [asyncio.create_task(db.watch_version()), asyncio.create_task(sync_trending())]
+    if broker.relay:
+        background.append(asyncio.create_task(broker.relay.run()))
+    if settings.run_scraper:
+        background.append(asyncio.create_task(run_scraper_leader()))
     yield
     logger.info("Shutting down News Aggregator API...")
+    for task in background:
+        task.cancel()
+    await asyncio.gather(*background, return_exceptions=True)
+    await db.save_trending_buckets(trending.snapshot(changed_only=True))
     await scraper.close()
     await db.disconnect()
 
@@ -47,6 +72,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request latency per route, exposed on /metrics
+app.add_middleware(MetricsMiddleware)
+
+Gauge("response_cache_hit_ratio", "Response cache hit ratio", lambda: response_cache.stats()["hit_ratio"])
+Gauge("response_cache_bytes", "Bytes held by the response cache", lambda: response_cache.size)
+Gauge("event_stream_clients", "Connected live event stream clients", lambda: len(broker.subscribers))
+Gauge("scraper_leader", "Whether this process holds the scraper lease", lambda: int(elector.is_leader))
+Gauge("scrape_job_running", "Whether a scrape job is running in this process", lambda: int(coordinator.running is not None))
+
+profiler = SamplingProfiler()
+
 # Background task for periodic scraping
 async def periodic_scraping():
     while True:
@@ -56,27 +92,102 @@ async def periodic_scraping():
             logger.info("Periodic scraping completed")
         except Exception as e:
             logger.error(f"Error in periodic scraping: {e}")
+        await db.update_scraping_status(
+            next_scrape=datetime.now() + timedelta(minutes=settings.scraping_interval_minutes)
+        )
         await asyncio.sleep(settings.scraping_interval_minutes * 60)
 
-# Core function to scrape and analyze
-async def scrape_and_analyze_news():
+# Scrape triggers and cancellations received by processes that do not hold the scraper lease
+async def forwarded_scrape_requests():
+    while True:
+        request = await db.pop_scrape_request()
+        if request:
+            await submit_forwarded(request)
+            continue
+        await coordinator.apply_cancel_requests()
+        await asyncio.sleep(settings.version_poll_seconds)
+
+async def submit_forwarded(request: dict):
+    job_id = request.get("job_id")
+    if job_id and await db.get_cancel_requests([job_id]):
+        # Cancelled before this process picked it up
+        job = await db.get_scrape_job(job_id)
+        if job:
+            job.status = "cancelled"
+            job.finished_at = datetime.now()
+            await db.save_scrape_job(job)
+        return
     try:
-        articles = await scraper.scrape_all_sources()
-        if not articles:
-            logger.warning("No articles scraped.")
-            return []
+        await coordinator.submit(request.get("sources"), job_id)
+    except ValueError as e:
+        logger.warning(f"Ignoring forwarded scrape request: {e}")
 
-        for article in articles:
-            sentiment_data = sentiment_analyzer.analyze(article.content or article.summary)
-            article.sentiment = sentiment_data['sentiment']
-            article.sentiment_score = sentiment_data['score']
+# The trending index is fed where articles are saved; other processes follow its snapshots
+async def sync_trending():
+    generation = await db.get_trending_generation()
+    while True:
+        await asyncio.sleep(settings.trending_snapshot_seconds)
+        current = await db.get_trending_generation()
+        if current != generation:
+            # Articles were cleared, possibly by another process: drop the counts from before
+            generation = current
+            trending.clear()
+            if elector.is_leader:
+                # Buckets this process saved while the clear ran would otherwise come back
+                await db.clear_trending_buckets()
+            continue
+        changed = trending.snapshot(changed_only=True)
+        if changed:
+            await db.save_trending_buckets(changed)
+        elif not elector.is_leader:
+            trending.restore(await db.load_trending_buckets())
 
-        await db.save_articles(articles)
-        logger.info(f"Scraped and analyzed {len(articles)} articles")
-        return articles
-    except Exception as e:
-        logger.error(f"Error in scrape_and_analyze_news: {e}")
-        return []
+async def scraper_leader_work():
+    try:
+        await asyncio.gather(periodic_scraping(), forwarded_scrape_requests())
+    finally:
+        # Without the lease this process must not start, or keep running, any scrape
+        await coordinator.stop()
+
+async def run_scraper_leader():
+    """Scrape only while this process holds the scraper lease"""
+    await elector.run(lease_for(db), scraper_leader_work)
+
+# Core function to scrape and analyze
+async def scrape_and_analyze_news() -> ScrapeJob:
+    """Scrape every source, joining a run that is already in flight"""
+    return await coordinator.wait(await coordinator.submit())
+
+async def cached_json_response(
+    request: Request,
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    producer: Callable[[], Awaitable[Any]]
+) -> Response:
+    """Serve a read endpoint from the response cache, answering 304 when the client copy is current"""
+    version = db.version
+    key = ResponseCache.make_key(endpoint, params)
+    entry = response_cache.get(key, version)
+    if entry is None:
+        token = read_failed.set(False)
+        try:
+            data = await producer()
+            # Never cache a failed read's empty fallback; it would outlive the outage
+            if read_failed.get():
+                raise RuntimeError("database read failed")
+        finally:
+            read_failed.reset(token)
+        body = json.dumps(
+            jsonable_encoder(data),
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+        entry = response_cache.put(key, body, version)
+
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
 
 # Routes
 @app.get("/")
@@ -84,47 +195,226 @@ async def root():
     return {"message": "News Aggregator Sentiment Analysis API", "status": "running"}
 
 @app.get("/api/articles", response_model=list[NewsArticle])
-async def get_articles(limit: int = 50, sentiment: str = "all", source: str = "all", category: str = "all", search: str = ""):
+async def get_articles(request: Request, limit: int = 50, sentiment: str = "all", source: str = "all", category: str = "all", search: str = ""):
     try:
-        return await db.get_articles(
-            limit=limit,
-            sentiment=None if sentiment == "all" else sentiment,
-            source=None if source == "all" else source,
-            category=None if category == "all" else category,
-            search=None if not search else search
+        filters = {
+            "limit": limit,
+            "sentiment": None if sentiment == "all" else sentiment,
+            "source": None if source == "all" else source,
+            "category": None if category == "all" else category,
+            "search": None if not search else search
+        }
+        return await cached_json_response(
+            request, "articles", filters, lambda: db.get_articles(**filters)
         )
     except Exception as e:
         logger.error(f"Error getting articles: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch articles")
 
 @app.get("/api/sentiment-stats", response_model=SentimentStats)
-async def get_sentiment_stats():
+async def get_sentiment_stats(request: Request):
     try:
-        return await db.get_sentiment_stats()
+        return await cached_json_response(request, "sentiment-stats", None, db.get_sentiment_stats)
     except Exception as e:
         logger.error(f"Error getting sentiment stats: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch sentiment statistics")
 
 @app.get("/api/sources")
-async def get_sources():
+async def get_sources(request: Request):
     try:
-        return {"sources": await db.get_unique_sources()}
+        async def produce():
+            return {"sources": await db.get_unique_sources()}
+        return await cached_json_response(request, "sources", None, produce)
     except Exception as e:
         logger.error(f"Error getting sources: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch sources")
 
+@app.get("/api/sources/health", response_model=list[SourceState])
+async def get_source_health():
+    try:
+        states = {state.name: state for state in await db.get_source_states()}
+        return [states.get(source.name, SourceState(name=source.name)) for source in settings.news_sources]
+    except Exception as e:
+        logger.error(f"Error getting source health: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch source health")
+
 @app.get("/api/categories")
-async def get_categories():
+async def get_categories(request: Request):
     try:
-        return {"categories": await db.get_unique_categories()}
+        async def produce():
+            return {"categories": await db.get_unique_categories()}
+        return await cached_json_response(request, "categories", None, produce)
     except Exception as e:
         logger.error(f"Error getting categories: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch categories")
 
+@app.get("/api/trending", response_model=TrendingTerms)
+async def get_trending(window: str = "hour", source: str = "all", category: str = "all", limit: int = 20, min_count: int = 1):
+    if window not in WINDOWS:
+        raise HTTPException(status_code=400, detail=f"Unknown window: {window}")
+    try:
+        return trending.top(window, source, category, limit=min(limit, 100), min_count=min_count)
+    except Exception as e:
+        logger.error(f"Error getting trending terms: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch trending terms")
+
+@app.get("/api/dashboard", response_model=DashboardData)
+async def get_dashboard(request: Request, limit: int = 50, sentiment: str = "all", source: str = "all", category: str = "all", search: str = ""):
+    try:
+        filters = {
+            "limit": max(1, min(limit, 100)),
+            "sentiment": None if sentiment == "all" else sentiment,
+            "source": None if source == "all" else source,
+            "category": None if category == "all" else category,
+            "search": None if not search else search
+        }
+        return await cached_json_response(
+            request, "dashboard", filters, lambda: db.get_dashboard(**filters)
+        )
+    except Exception as e:
+        logger.error(f"Error getting dashboard: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch dashboard")
+
+@app.get("/api/export")
+async def export_articles(
+    request: Request,
+    format: str = "ndjson",
+    sentiment: str = "all",
+    source: str = "all",
+    category: str = "all",
+    search: str = "",
+    since: Optional[datetime] = None
+):
+    """Stream matching articles as NDJSON or CSV, oldest scrape first"""
+    if format not in MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="format must be 'ndjson' or 'csv'")
+    if since and since.tzinfo:
+        # Articles are stamped with naive local time
+        since = since.astimezone().replace(tzinfo=None)
+
+    docs = db.iter_articles(
+        sentiment=None if sentiment == "all" else sentiment,
+        source=None if source == "all" else source,
+        category=None if category == "all" else category,
+        search=None if not search else search,
+        since=since
+    )
+    compress = "gzip" in request.headers.get("accept-encoding", "")
+    headers = {
+        "Content-Disposition": f'attachment; filename="articles.{format}"',
+        "Vary": "Accept-Encoding"
+    }
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        encode_export(docs, format, compress),
+        media_type=MEDIA_TYPES[format],
+        headers=headers
+    )
+
+@app.get("/api/stream")
+async def stream_events(
+    request: Request,
+    sentiment: str = "all",
+    source: str = "all",
+    category: str = "all",
+    last_event_id: Optional[int] = None
+):
+    """Server-sent events for new articles, sentiment stat deltas and scrape status changes"""
+    if last_event_id is None:
+        header = request.headers.get("last-event-id")
+        last_event_id = int(header) if header and header.isdigit() else None
+
+    subscriber = broker.subscribe({
+        "sentiment": None if sentiment == "all" else sentiment,
+        "source": None if source == "all" else source,
+        "category": None if category == "all" else category
+    })
+
+    async def event_source():
+        try:
+            yield "retry: 5000\n\n"
+            replayed = set()
+            if last_event_id is not None:
+                missed = broker.replay(subscriber, last_event_id)
+                if missed is None:
+                    yield broker.reset_event().encode()
+                else:
+                    for event in missed:
+                        replayed.add(event.id)
+                        yield event.encode()
+
+            while not await request.is_disconnected():
+                event = await subscriber.next_event(settings.event_heartbeat_seconds)
+                if event is None:
+                    yield ": keepalive\n\n"
+                elif event.id not in replayed or event.type == "reset":
+                    # Events published while replaying are also queued; send them once
+                    yield event.encode()
+        finally:
+            broker.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/metrics")
+async def get_metrics():
+    return Response(content=render_metrics(), media_type="text/plain; version=0.0.4")
+
+@app.get("/api/debug/profile")
+async def profile_event_loop(seconds: float = 10):
+    """Sample the event loop thread and return collapsed stacks for a flame graph"""
+    if not settings.profiler_enabled:
+        raise HTTPException(status_code=404, detail="Profiler is disabled")
+    loop_thread = threading.get_ident()
+    stacks = await asyncio.get_running_loop().run_in_executor(
+        None, profiler.profile, min(seconds, 60), loop_thread
+    )
+    return Response(content=stacks, media_type="text/plain")
+
+@app.get("/api/cache-stats")
+async def get_cache_stats():
+    return response_cache.stats()
+
 @app.post("/api/scrape")
-async def trigger_scraping(background_tasks: BackgroundTasks):
-    background_tasks.add_task(scrape_and_analyze_news)
-    return {"message": "Scraping started in background", "status": "triggered"}
+async def trigger_scraping(sources: Optional[List[str]] = Query(default=None)):
+    try:
+        if not elector.is_leader:
+            # Another process owns scraping; hand the trigger over
+            job = await coordinator.forward(sources)
+            return {"message": "Scraping requested from the scraper worker", "status": "forwarded", "job_id": job.id}
+        job = await coordinator.submit(sources)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"message": f"Scraping {job.status}", "status": job.status, "job_id": job.id}
+
+@app.get("/api/scrape/jobs", response_model=list[ScrapeJob])
+async def list_scrape_jobs():
+    return await db.list_scrape_jobs()
+
+@app.get("/api/scrape/jobs/{job_id}", response_model=ScrapeJob)
+async def get_scrape_job(job_id: str):
+    # Jobs run by this process are fresher locally; others come from the shared record
+    job = coordinator.get(job_id) or await db.get_scrape_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Scrape job not found")
+    return job
+
+@app.delete("/api/scrape/jobs/{job_id}", response_model=ScrapeJob)
+async def cancel_scrape_job(job_id: str):
+    job = coordinator.get(job_id) or await db.get_scrape_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Scrape job not found")
+    if coordinator.get(job.id):
+        return await coordinator.cancel(job.id)
+    if job.status in ("queued", "running"):
+        # Picked up by the process running the job within a poll interval
+        await db.request_scrape_job_cancel(job.id)
+    return job
 
 @app.get("/api/scraping-status", response_model=ScrapingStatus)
 async def get_scraping_status():
@@ -147,18 +437,16 @@ async def clear_articles():
 async def scrape_cnn():
     try:
         cnn_config = settings.news_sources[2]  # CNN config
-        articles = await scraper.scrape_source(cnn_config)
+        if not elector.is_leader:
+            job = await coordinator.forward([cnn_config.name])
+            return {"message": "CNN scrape requested from the scraper worker.", "job_id": job.id}
+        job = await coordinator.wait(await coordinator.submit([cnn_config.name]))
+        articles = job.progress[cnn_config.name].articles
 
         if not articles:
-            return {"message": "No articles scraped for CNN."}
-
-        for article in articles:
-            sentiment_data = sentiment_analyzer.analyze(article.content or article.summary)
-            article.sentiment = sentiment_data['sentiment']
-            article.sentiment_score = sentiment_data['score']
+            return {"message": "No articles scraped for CNN.", "job_id": job.id}
 
-        await db.save_articles(articles)
-        return {"message": f"{len(articles)} CNN articles scraped and saved."}
+        return {"message": f"{articles} CNN articles scraped and saved.", "job_id": job.id}
 
     except Exception as e:
         logger.error(f"Error scraping CNN: {e}")
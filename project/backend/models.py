@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from enum import Enum
 
@@ -35,12 +35,50 @@ class SentimentStats(BaseModel):
     neutral: int = 0
     total: int = 0
 
+class DashboardData(BaseModel):
+    articles: List[NewsArticle] = []
+    stats: SentimentStats = SentimentStats()
+    sources: List[str] = []
+    categories: List[str] = []
+    # Per-value counts for each filter, computed with every other active filter applied
+    facets: Dict[str, Dict[str, int]] = {}
+
+class TrendingTerm(BaseModel):
+    term: str
+    # Recent articles mentioning the term, and their average sentiment score
+    count: int
+    sentiment_score: float
+    sentiment: SentimentType
+
+class TrendingTerms(BaseModel):
+    window: str
+    since: datetime
+    terms: List[TrendingTerm] = []
+
 class ScrapingStatus(BaseModel):
     last_scrape: Optional[datetime] = None
     articles_scraped: int = 0
     sources_active: int = 0
     status: str = "idle"
     next_scrape: Optional[datetime] = None
+    job_id: Optional[str] = None
+
+class SourceProgress(BaseModel):
+    status: str = "pending"
+    articles: int = 0
+    error: Optional[str] = None
+
+class ScrapeJob(BaseModel):
+    id: str
+    sources: List[str]
+    status: str = "queued"
+    progress: Dict[str, SourceProgress] = {}
+    articles_scraped: int = 0
+    # Number of triggers merged into this job
+    requests: int = 1
+    created_at: datetime = Field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
 
 class NewsSource(BaseModel):
     id: str
@@ -60,4 +98,18 @@ class SourceConfig(BaseModel):
     url: str
     category: str
     selectors: Optional[SelectorConfig] = None  
+    # Overrides settings.source_deadline_seconds for this source
+    deadline_seconds: Optional[float] = None
+
+class SourceState(BaseModel):
+    name: str
+    # Strategy ("requests" or "selenium") that last produced articles
+    strategy: Optional[str] = None
+    last_latency: Optional[float] = None
+    last_success: Optional[datetime] = None
+    last_failure: Optional[datetime] = None
+    last_error: Optional[str] = None
+    failure_streak: int = 0
+    # Circuit breaker: the source is skipped until this time
+    suspended_until: Optional[datetime] = None
     
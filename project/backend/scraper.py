@@ -7,20 +7,30 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
-from typing import List, Optional
+import time
+from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
-from models import NewsArticle, SentimentType, SourceConfig
+from models import NewsArticle, SentimentType, SourceConfig, SourceState
 from config import settings
+from metrics import (
+    SCRAPE_FETCH_SECONDS, SCRAPE_PARSE_SECONDS, SCRAPE_SELENIUM_SECONDS,
+    SCRAPE_ARTICLES_TOTAL, SCRAPE_ERRORS_TOTAL
+)
 
 logger = logging.getLogger(__name__)
 
+STRATEGIES = ("requests", "selenium")
+
 class NewsScraper:
     def __init__(self):
         self.session = None
         self.driver = None
+        # One browser is shared, so Selenium scrapes run one at a time
+        self.browser_lock = asyncio.Lock()
+        self.states: Dict[str, SourceState] = {}
 
     async def get_session(self):
         if not self.session:
@@ -52,12 +62,16 @@ class NewsScraper:
         articles = []
         try:
             session = await self.get_session()
-            async with session.get(source_config.url) as response:
-                if response.status != 200:
-                    logger.warning(f"Failed to fetch {source_config.name}: {response.status}")
-                    return articles
+            with SCRAPE_FETCH_SECONDS.time(source=source_config.name):
+                async with session.get(source_config.url) as response:
+                    if response.status != 200:
+                        logger.warning(f"Failed to fetch {source_config.name}: {response.status}")
+                        SCRAPE_ERRORS_TOTAL.inc(source=source_config.name, strategy="requests")
+                        return articles
+
+                    html = await response.text()
 
-                html = await response.text()
+            with SCRAPE_PARSE_SECONDS.time(source=source_config.name):
                 soup = BeautifulSoup(html, "html.parser")
                 elements = soup.select(source_config.selectors.articles)
 
@@ -70,30 +84,41 @@ class NewsScraper:
                         logger.error(f"Error extracting article from {source_config.name}: {e}")
         except Exception as e:
             logger.error(f"Error scraping {source_config.name} with requests: {e}")
+            SCRAPE_ERRORS_TOTAL.inc(source=source_config.name, strategy="requests")
+        SCRAPE_ARTICLES_TOTAL.inc(len(articles), source=source_config.name, strategy="requests")
         return articles
 
-    def scrape_with_selenium(self, source_config: SourceConfig) -> List[NewsArticle]:
+    def scrape_with_selenium(self, source_config: SourceConfig, budget: Optional[float] = None) -> List[NewsArticle]:
         articles = []
         driver = self.get_driver()
         if not driver:
+            SCRAPE_ERRORS_TOTAL.inc(source=source_config.name, strategy="selenium")
             return articles
 
+        budget = budget or settings.source_deadline_seconds
+        ends = time.monotonic() + budget
         try:
-            driver.get(source_config.url)
-            WebDriverWait(driver, settings.selenium_timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, source_config.selectors.articles))
-            )
+            with SCRAPE_SELENIUM_SECONDS.time(source=source_config.name):
+                # A hung page must not hold the shared browser past this attempt's budget
+                driver.set_page_load_timeout(min(budget, settings.selenium_page_load_timeout))
+                driver.get(source_config.url)
+                wait = min(settings.selenium_timeout, max(ends - time.monotonic(), 0.1))
+                WebDriverWait(driver, wait).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, source_config.selectors.articles))
+                )
 
-            elements = driver.find_elements(By.CSS_SELECTOR, source_config.selectors.articles)
-            for element in elements[:settings.max_articles_per_source]:
-                try:
-                    article = self.extract_article_data_selenium(element, source_config)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    logger.error(f"Error extracting article from {source_config.name}: {e}")
+                elements = driver.find_elements(By.CSS_SELECTOR, source_config.selectors.articles)
+                for element in elements[:settings.max_articles_per_source]:
+                    try:
+                        article = self.extract_article_data_selenium(element, source_config)
+                        if article:
+                            articles.append(article)
+                    except Exception as e:
+                        logger.error(f"Error extracting article from {source_config.name}: {e}")
         except Exception as e:
             logger.error(f"Error scraping {source_config.name} with Selenium: {e}")
+            SCRAPE_ERRORS_TOTAL.inc(source=source_config.name, strategy="selenium")
+        SCRAPE_ARTICLES_TOTAL.inc(len(articles), source=source_config.name, strategy="selenium")
         return articles
 
     async def extract_article_data(self, element, source_config: SourceConfig) -> Optional[NewsArticle]:
@@ -182,17 +207,104 @@ class NewsScraper:
             return 1
         return max(1, round(len(text.split()) / 200))
 
+    def source_state(self, name: str) -> SourceState:
+        if name not in self.states:
+            self.states[name] = SourceState(name=name)
+        return self.states[name]
+
+    def load_states(self, states: List[SourceState]):
+        """Adopt persisted per-source state, e.g. after a restart or failover"""
+        for state in states:
+            self.states[state.name] = state
+
+    def is_suspended(self, name: str) -> bool:
+        state = self.source_state(name)
+        return bool(state.suspended_until and state.suspended_until > datetime.now())
+
+    async def run_strategy(self, strategy: str, source_config: SourceConfig, timeout: float) -> List[NewsArticle]:
+        """Run one strategy, raising asyncio.TimeoutError past timeout.
+
+        For Selenium the caller must hold browser_lock. It is released when the
+        browser thread actually finishes, which can be after the timeout.
+        """
+        if strategy == "selenium":
+            # Keep the blocking browser off the event loop so other sources carry on
+            thread = asyncio.ensure_future(
+                asyncio.to_thread(self.scrape_with_selenium, source_config, timeout)
+            )
+            thread.add_done_callback(lambda _: self.browser_lock.release())
+            return await asyncio.wait_for(asyncio.shield(thread), timeout=timeout)
+        return await asyncio.wait_for(self.scrape_with_requests(source_config), timeout=timeout)
+
     async def scrape_source(self, source_config: SourceConfig) -> List[NewsArticle]:
+        state = self.source_state(source_config.name)
+        if self.is_suspended(source_config.name):
+            logger.info(f"Skipping {source_config.name}: suspended until {state.suspended_until:%H:%M}")
+            return []
+
         logger.info(f"Scraping {source_config.name}...")
-        articles = await self.scrape_with_requests(source_config)
-
-        if not articles:
-            logger.warning(f"No articles scraped from {source_config.name} using requests.")
-            logger.info(f"Trying Selenium for {source_config.name}")
-            articles = self.scrape_with_selenium(source_config)
-            
-        logger.info(f"{source_config.name}: Scraped {len(articles)} articles.")
-        return articles
+        budget = source_config.deadline_seconds or settings.source_deadline_seconds
+        deadline = time.monotonic() + budget
+        # Start with whatever worked last time
+        strategies = sorted(STRATEGIES, key=lambda s: s != state.strategy)
+
+        error = None
+        for strategy in strategies:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            timeout = remaining
+            if strategy == "selenium":
+                # Waiting for the shared browser is not this source's fault; its clock starts once it has it
+                await self.browser_lock.acquire()
+                deadline = time.monotonic() + remaining
+                # Sources queue for the browser, so a dead site gets one page load and one wait, not its whole budget
+                timeout = min(remaining, settings.selenium_page_load_timeout + settings.selenium_timeout)
+            started = time.monotonic()
+            try:
+                articles = await self.run_strategy(strategy, source_config, timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"{source_config.name}: {strategy} exceeded its {timeout:.0f}s limit")
+                SCRAPE_ERRORS_TOTAL.inc(source=source_config.name, strategy=strategy)
+                error = f"{strategy} timed out"
+                continue
+
+            if articles:
+                self._record_success(state, strategy, time.monotonic() - started)
+                logger.info(f"{source_config.name}: Scraped {len(articles)} articles using {strategy}.")
+                return articles
+
+            logger.warning(f"No articles scraped from {source_config.name} using {strategy}.")
+            error = f"no articles from {strategy}"
+
+        self._record_failure(state, error or "deadline exhausted")
+        return []
+
+    def _record_success(self, state: SourceState, strategy: str, latency: float):
+        state.strategy = strategy
+        state.last_latency = round(latency, 3)
+        state.last_success = datetime.now()
+        state.failure_streak = 0
+        state.suspended_until = None
+        state.last_error = None
+
+    def _record_failure(self, state: SourceState, error: str):
+        state.failure_streak += 1
+        state.last_failure = datetime.now()
+        state.last_error = error
+
+        over = state.failure_streak - settings.circuit_breaker_threshold
+        if over >= 0:
+            # Back off exponentially while the source keeps failing
+            cooldown = min(
+                settings.circuit_breaker_cooldown_minutes * 2 ** over,
+                settings.circuit_breaker_max_cooldown_minutes
+            )
+            state.suspended_until = state.last_failure + timedelta(minutes=cooldown)
+            logger.warning(
+                f"{state.name}: {state.failure_streak} failures in a row, "
+                f"suspended for {cooldown} minutes"
+            )
 
     async def scrape_all_sources(self) -> List[NewsArticle]:
         all_articles = []
@@ -3,6 +3,8 @@ from textblob import TextBlob
 import logging
 from typing import Dict
 
+from metrics import SENTIMENT_SECONDS
+
 logger = logging.getLogger(__name__)
 
 class SentimentAnalyzer:
@@ -40,6 +42,10 @@ class SentimentAnalyzer:
     
     def analyze(self, text: str) -> Dict[str, any]:
         """Comprehensive sentiment analysis"""
+        with SENTIMENT_SECONDS.time():
+            return self._analyze(text)
+
+    def _analyze(self, text: str) -> Dict[str, any]:
         if not text or not text.strip():
             return {
                 'sentiment': 'neutral',
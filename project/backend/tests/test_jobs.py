@@ -0,0 +1,201 @@
+import asyncio
+
+from config import settings
+from database import Database
+from jobs import ScrapeCoordinator
+from models import NewsArticle
+from scraper import NewsScraper
+
+FIRST, SECOND = settings.news_sources[0].name, settings.news_sources[1].name
+
+
+class GatedScraper(NewsScraper):
+    """Scrapes return one article each, once the test opens the gate"""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = asyncio.Event()
+        self.calls = []
+
+    async def scrape_source(self, source_config):
+        self.calls.append(source_config.name)
+        await self.gate.wait()
+        return [NewsArticle(
+            title=f"Story from {source_config.name}",
+            url=f"https://example.com/{len(self.calls)}",
+            source=source_config.name,
+            sentiment="neutral",
+            sentiment_score=0.0,
+            category=source_config.category
+        )]
+
+
+class NeutralAnalyzer:
+    def analyze(self, text):
+        return {"sentiment": "neutral", "score": 0.0}
+
+
+def make_coordinator():
+    db = Database()
+    db.use_in_memory()
+    scraper = GatedScraper()
+    return ScrapeCoordinator(scraper, NeutralAnalyzer(), db), scraper, db
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_trigger_joins_running_job_covering_its_sources():
+    async def scenario():
+        coordinator, scraper, _ = make_coordinator()
+        running = await coordinator.submit([FIRST, SECOND])
+        await settle()
+        joined = await coordinator.submit([FIRST])
+        assert joined is running
+        assert running.requests == 2 and coordinator.queued is None
+
+        scraper.gate.set()
+        await coordinator.wait(running)
+        assert running.status == "completed"
+        assert running.articles_scraped == 2
+
+    asyncio.run(scenario())
+
+
+def test_triggers_merge_into_one_queued_job():
+    async def scenario():
+        coordinator, scraper, _ = make_coordinator()
+        running = await coordinator.submit([FIRST])
+        await settle()
+        queued = await coordinator.submit([SECOND])
+        merged = await coordinator.submit([FIRST, SECOND])
+        assert merged is queued
+        assert queued.status == "queued" and queued.requests == 2
+        assert queued.sources == [SECOND, FIRST]
+
+        scraper.gate.set()
+        await coordinator.wait(running)
+        await coordinator.wait(queued)
+        assert queued.status == "completed"
+        assert sorted(scraper.calls[1:]) == sorted([FIRST, SECOND])
+
+    asyncio.run(scenario())
+
+
+def test_cancel_queued_job():
+    async def scenario():
+        coordinator, scraper, db = make_coordinator()
+        running = await coordinator.submit([FIRST])
+        await settle()
+        queued = await coordinator.submit([SECOND])
+
+        await coordinator.cancel(queued.id)
+        assert queued.status == "cancelled" and coordinator.queued is None
+        assert (await db.get_scrape_job(queued.id)).status == "cancelled"
+
+        scraper.gate.set()
+        await coordinator.wait(running)
+        await settle()
+        assert coordinator.running is None
+        assert scraper.calls == [FIRST]
+
+    asyncio.run(scenario())
+
+
+def test_cancel_running_job_starts_queued_one():
+    async def scenario():
+        coordinator, scraper, _ = make_coordinator()
+        running = await coordinator.submit([FIRST])
+        await settle()
+        queued = await coordinator.submit([SECOND])
+
+        await coordinator.cancel(running.id)
+        assert running.status == "cancelled"
+        assert running.progress[FIRST].status == "cancelled"
+        assert coordinator.running is queued and queued.status == "running"
+
+        scraper.gate.set()
+        await coordinator.wait(queued)
+        assert queued.status == "completed"
+
+    asyncio.run(scenario())
+
+
+def test_stop_does_not_promote_queued_job():
+    async def scenario():
+        coordinator, scraper, _ = make_coordinator()
+        running = await coordinator.submit([FIRST])
+        await settle()
+        queued = await coordinator.submit([SECOND])
+
+        await coordinator.stop()
+        await settle()
+        assert running.status == "cancelled" and queued.status == "cancelled"
+        assert coordinator.running is None and coordinator.queued is None
+        assert scraper.calls == [FIRST]
+
+        # The next leadership term starts cleanly
+        job = await coordinator.submit([SECOND])
+        await settle()
+        assert job.status == "running"
+        await coordinator.stop()
+
+    asyncio.run(scenario())
+
+
+def test_forwarded_trigger_that_joins_is_aliased():
+    async def scenario():
+        coordinator, scraper, db = make_coordinator()
+        replica = ScrapeCoordinator(None, None, db)
+        running = await coordinator.submit([FIRST])
+        await settle()
+
+        forwarded = await replica.forward([FIRST])
+        request = await db.pop_scrape_request()
+        assert request["job_id"] == forwarded.id
+        await coordinator.submit(request["sources"], request["job_id"])
+
+        # The id the replica handed out now resolves to the job serving it
+        assert (await db.get_scrape_job(forwarded.id)).id == running.id
+
+        scraper.gate.set()
+        await coordinator.wait(running)
+
+    asyncio.run(scenario())
+
+
+def test_cancel_requested_by_another_process():
+    async def scenario():
+        coordinator, scraper, db = make_coordinator()
+        running = await coordinator.submit([FIRST])
+        await settle()
+        queued = await coordinator.submit([SECOND])
+
+        await db.request_scrape_job_cancel(queued.id)
+        await coordinator.apply_cancel_requests()
+        assert queued.status == "cancelled"
+        assert coordinator.running is running
+
+        scraper.gate.set()
+        await coordinator.wait(running)
+
+    asyncio.run(scenario())
+
+
+def test_old_jobs_expire(monkeypatch):
+    async def scenario():
+        coordinator, scraper, db = make_coordinator()
+        scraper.gate.set()
+        monkeypatch.setattr(settings, "scrape_job_retention_hours", 0)
+        old = await coordinator.submit([FIRST])
+        await coordinator.wait(old)
+
+        monkeypatch.setattr(settings, "scrape_job_retention_hours", 24)
+        new = await coordinator.submit([SECOND])
+        await coordinator.wait(new)
+        assert await db.get_scrape_job(old.id) is None
+        assert [job.id for job in await db.list_scrape_jobs()] == [new.id]
+
+    asyncio.run(scenario())
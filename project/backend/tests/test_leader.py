@@ -0,0 +1,108 @@
+import asyncio
+
+from leader import LeaderElector, LocalLease
+
+
+def test_lease_is_exclusive_until_it_expires():
+    async def scenario():
+        lease = LocalLease()
+        assert await lease.acquire("scraper", "a", 0.2)
+        assert not await lease.acquire("scraper", "b", 0.2)
+        # The holder renews freely
+        assert await lease.acquire("scraper", "a", 0.2)
+        await asyncio.sleep(0.3)
+        assert await lease.acquire("scraper", "b", 0.2)
+        assert not await lease.acquire("scraper", "a", 0.2)
+
+    asyncio.run(scenario())
+
+
+def test_release_only_by_holder():
+    async def scenario():
+        lease = LocalLease()
+        await lease.acquire("scraper", "a", 10)
+        await lease.release("scraper", "b")
+        assert not await lease.acquire("scraper", "b", 10)
+        await lease.release("scraper", "a")
+        assert await lease.acquire("scraper", "b", 10)
+
+    asyncio.run(scenario())
+
+
+def test_failover_to_standby_when_leader_stops():
+    async def scenario():
+        lease = LocalLease()
+        first, second = LeaderElector("scraper", 0.3), LeaderElector("scraper", 0.3)
+        started = []
+
+        def work(name):
+            async def run():
+                started.append(name)
+                await asyncio.Event().wait()
+            return run
+
+        first_run = asyncio.create_task(first.run(lease, work("first")))
+        await asyncio.sleep(0.05)
+        second_run = asyncio.create_task(second.run(lease, work("second")))
+        await asyncio.sleep(0.05)
+        assert first.is_leader and not second.is_leader
+
+        first_run.cancel()
+        await asyncio.gather(first_run, return_exceptions=True)
+        await asyncio.sleep(0.2)
+        assert second.is_leader
+        assert started == ["first", "second"]
+
+        second_run.cancel()
+        await asyncio.gather(second_run, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_standby_takes_over_an_expired_lease():
+    async def scenario():
+        lease = LocalLease()
+        # A holder that died without releasing
+        await lease.acquire("scraper", "dead", 0.2)
+        elector = LeaderElector("scraper", 0.15)
+        run = asyncio.create_task(elector.run(lease, lambda: asyncio.Event().wait()))
+        await asyncio.sleep(0.05)
+        assert not elector.is_leader
+        await asyncio.sleep(0.3)
+        assert elector.is_leader
+
+        run.cancel()
+        await asyncio.gather(run, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_leader_stops_work_when_lease_is_lost():
+    async def scenario():
+        lease = LocalLease()
+        elector = LeaderElector("scraper", 0.3)
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        run = asyncio.create_task(elector.run(lease, work))
+        await asyncio.sleep(0.05)
+        assert elector.is_leader
+
+        # Another owner took the lease, e.g. after this process stalled past its expiry
+        await lease.release("scraper", elector.owner)
+        await lease.acquire("scraper", "other", 10)
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert not elector.is_leader
+
+        run.cancel()
+        await asyncio.gather(run, return_exceptions=True)
+        # The lease of the new holder is left alone
+        assert not await lease.acquire("scraper", "third", 10)
+
+    asyncio.run(scenario())
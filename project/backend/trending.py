@@ -0,0 +1,245 @@
+from datetime import datetime, timezone
+from heapq import nlargest
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import re
+import logging
+
+from models import NewsArticle, TrendingTerm, TrendingTerms
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Window name -> (span, bucket width) in seconds. Counts are kept per bucket, so a
+# query merges at most span / width buckets whatever the size of the archive.
+WINDOWS: Dict[str, Tuple[int, int]] = {
+    "hour": (3600, 300),
+    "day": (86400, 3600),
+}
+
+STOP_WORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been
+before being below between both but by can could did do does doing down during each
+few for from further had has have having he her here hers herself him himself his how
+i if in into is it its itself just let me more most my myself no nor not now of off on
+once only or other our ours ourselves out over own same she should so some such than
+that the their theirs them themselves then there these they this those through to too
+under until up very was we were what when where which while who whom why will with
+would you your yours yourself yourselves
+amid among via per vs new says said say told tells according could may might must
+one two three first last year years day days week weeks today yesterday tomorrow
+get gets got make makes made take takes took back still yet even many much
+news live update updates latest read watch video photos report reports here's what's
+""".split())
+
+# Sentence punctuation ends a phrase; so does a stop word
+PHRASE_BREAK = re.compile(r"[.,;:!?()\[\]\"“”|–—]+")
+TOKEN = re.compile(r"[a-z][a-z0-9]*(?:['’\-][a-z0-9]+)*")
+
+
+def extract_terms(text: str) -> Set[str]:
+    """Distinct words and two-word phrases worth counting in a piece of text"""
+    terms = set()
+    for segment in PHRASE_BREAK.split(text.lower()):
+        previous = None
+        for token in TOKEN.findall(segment):
+            if token.endswith(("'s", "’s")):
+                token = token[:-2]
+            if len(token) < 3 or token in STOP_WORDS:
+                previous = None
+                continue
+            terms.add(token)
+            if previous:
+                terms.add(f"{previous} {token}")
+            previous = token
+    return terms
+
+
+def article_scopes(article: NewsArticle) -> List[str]:
+    """Every filter combination an article can be queried under"""
+    return [
+        "all",
+        f"source:{article.source}",
+        f"category:{article.category}",
+        f"source:{article.source}|category:{article.category}",
+    ]
+
+
+def scope_for(source: Optional[str], category: Optional[str]) -> str:
+    parts = []
+    if source and source != "all":
+        parts.append(f"source:{source}")
+    if category and category != "all":
+        parts.append(f"category:{category}")
+    return "|".join(parts) or "all"
+
+
+class Bucket:
+    """Term counts and sentiment sums for one slice of time, per scope"""
+
+    __slots__ = ("start", "scopes", "changed")
+
+    def __init__(self, start: int):
+        self.start = start
+        # scope -> term -> [articles mentioning it, sum of their sentiment scores]
+        self.scopes: Dict[str, Dict[str, list]] = {}
+        self.changed = False
+
+    def add(self, scopes: List[str], terms: Iterable[str], score: float, capacity: int):
+        for scope in scopes:
+            counts = self.scopes.setdefault(scope, {})
+            for term in terms:
+                entry = counts.get(term)
+                if entry is None:
+                    counts[term] = [1, score]
+                else:
+                    entry[0] += 1
+                    entry[1] += score
+            if len(counts) > 2 * capacity:
+                # Keep the heavy hitters; rare terms cannot reach the top of a merged window
+                self.scopes[scope] = dict(nlargest(capacity, counts.items(), key=lambda kv: kv[1][0]))
+        self.changed = True
+
+
+class SlidingWindow:
+    def __init__(self, span: int, width: int, capacity: int):
+        self.span = span
+        self.width = width
+        self.capacity = capacity
+        self.buckets: Dict[int, Bucket] = {}
+
+    def cutoff(self, now: float) -> int:
+        """Start of the oldest bucket still inside the window"""
+        return int((now - self.span) // self.width + 1) * self.width
+
+    def expire(self, now: float):
+        cutoff = self.cutoff(now)
+        for start in [s for s in self.buckets if s < cutoff]:
+            del self.buckets[start]
+
+    def add(self, timestamp: float, scopes: List[str], terms: Set[str], score: float, now: float):
+        if timestamp < self.cutoff(now):
+            return
+        start = int(timestamp // self.width) * self.width
+        bucket = self.buckets.get(start)
+        if bucket is None:
+            bucket = self.buckets[start] = Bucket(start)
+        bucket.add(scopes, terms, score, self.capacity)
+
+    def top(self, scope: str, now: float, limit: int, min_count: int) -> List[Tuple[str, int, float]]:
+        cutoff = self.cutoff(now)
+        merged: Dict[str, list] = {}
+        for bucket in self.buckets.values():
+            counts = bucket.scopes.get(scope)
+            if bucket.start < cutoff or not counts:
+                continue
+            for term, (count, score_sum) in counts.items():
+                entry = merged.get(term)
+                if entry is None:
+                    merged[term] = [count, score_sum]
+                else:
+                    entry[0] += count
+                    entry[1] += score_sum
+        top = nlargest(limit, merged.items(), key=lambda kv: (kv[1][0], kv[0]))
+        return [(term, count, score_sum) for term, (count, score_sum) in top if count >= min_count]
+
+
+class TrendingIndex:
+    """Incremental top terms and phrases over recent articles.
+
+    Articles are folded in as they are saved, into fixed-width time buckets
+    for each window. Buckets older than the window are dropped, and each
+    bucket keeps only its most frequent terms per scope, so memory and query
+    cost stay bounded no matter how large the archive grows.
+    """
+
+    def __init__(self, capacity: int):
+        self.windows = {
+            name: SlidingWindow(span, width, capacity) for name, (span, width) in WINDOWS.items()
+        }
+
+    def add_articles(self, articles: List[NewsArticle], now: Optional[float] = None):
+        now = now or datetime.now().timestamp()
+        for window in self.windows.values():
+            window.expire(now)
+        for article in articles:
+            terms = extract_terms(f"{article.title}. {article.summary or ''}")
+            if not terms:
+                continue
+            timestamp = article.scraped_at.timestamp()
+            scopes = article_scopes(article)
+            for window in self.windows.values():
+                window.add(timestamp, scopes, terms, article.sentiment_score, now)
+
+    def top(
+        self,
+        window: str = "hour",
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        limit: int = 20,
+        min_count: int = 1,
+        now: Optional[float] = None
+    ) -> TrendingTerms:
+        now = now or datetime.now().timestamp()
+        sliding = self.windows[window]
+        terms = []
+        for term, count, score_sum in sliding.top(scope_for(source, category), now, limit, min_count):
+            score = round(score_sum / count, 3)
+            if score >= 0.05:
+                sentiment = "positive"
+            elif score <= -0.05:
+                sentiment = "negative"
+            else:
+                sentiment = "neutral"
+            terms.append(TrendingTerm(term=term, count=count, sentiment_score=score, sentiment=sentiment))
+        return TrendingTerms(
+            window=window,
+            since=datetime.fromtimestamp(sliding.cutoff(now)),
+            terms=terms
+        )
+
+    def clear(self):
+        for window in self.windows.values():
+            window.buckets.clear()
+
+    def snapshot(self, changed_only: bool = False) -> List[dict]:
+        """Buckets as documents for persistence; marks them as saved"""
+        docs = []
+        for name, window in self.windows.items():
+            for bucket in window.buckets.values():
+                if changed_only and not bucket.changed:
+                    continue
+                docs.append({
+                    "_id": f"{name}:{bucket.start}",
+                    "window": name,
+                    "start": bucket.start,
+                    # Lets the store drop buckets that have left the window; UTC, as the TTL monitor compares
+                    "expires_at": datetime.fromtimestamp(
+                        bucket.start + window.width + window.span, tz=timezone.utc
+                    ),
+                    "scopes": [
+                        [scope, [[term, count, score_sum] for term, (count, score_sum) in counts.items()]]
+                        for scope, counts in bucket.scopes.items()
+                    ],
+                })
+                bucket.changed = False
+        return docs
+
+    def restore(self, docs: List[dict]):
+        """Replace the index with previously snapshotted buckets"""
+        self.clear()
+        now = datetime.now().timestamp()
+        for doc in docs:
+            window = self.windows.get(doc.get("window"))
+            if window is None:
+                continue
+            bucket = Bucket(doc["start"])
+            bucket.scopes = {
+                scope: {term: [count, score_sum] for term, count, score_sum in entries}
+                for scope, entries in doc["scopes"]
+            }
+            window.buckets[bucket.start] = bucket
+        for window in self.windows.values():
+            window.expire(now)
+
+
+trending = TrendingIndex(capacity=settings.trending_capacity)
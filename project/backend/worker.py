@@ -0,0 +1,38 @@
+"""Standalone scraper worker.
+
+Runs the periodic scrape loop under the scraper lease, so API processes can
+be started with RUN_SCRAPER=false and serve reads only:
+
+    python worker.py
+"""
+import asyncio
+import logging
+
+from main import db, scraper, run_scraper_leader, sync_trending
+from trending import trending
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker():
+    logger.info("Starting scraper worker...")
+    await db.connect()
+    # Articles are saved here, so this is where the trending index is fed and snapshotted
+    trending.restore(await db.load_trending_buckets())
+    snapshots = asyncio.create_task(sync_trending())
+    try:
+        await run_scraper_leader()
+    finally:
+        logger.info("Shutting down scraper worker...")
+        snapshots.cancel()
+        await asyncio.gather(snapshots, return_exceptions=True)
+        await db.save_trending_buckets(trending.snapshot(changed_only=True))
+        await scraper.close()
+        await db.disconnect()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(run_worker())
+    except KeyboardInterrupt:
+        pass
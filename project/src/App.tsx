@@ -6,6 +6,7 @@ import { NewsCard } from './components/NewsCard';
 import { LoadingSpinner } from './components/LoadingSpinner';
 import { ErrorMessage } from './components/ErrorMessage';
 import { ScrapingControls } from './components/ScrapingControls';
+import { TrendingTerms } from './components/TrendingTerms';
 import { useNews } from './hooks/useNews';
 
 function App() {
@@ -24,6 +25,8 @@ function App() {
     sentimentStats,
     sources,
     categories,
+    facets,
+    dataVersion,
     refreshData,
     triggerScraping
   } = useNews();
@@ -41,6 +44,7 @@ function App() {
         onCategoryChange={setSelectedCategory}
         sources={sources}
         categories={categories}
+        facets={facets}
       />
 
       <main className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
@@ -57,6 +61,12 @@ function App() {
         ) : (
           <>
             <SentimentStats stats={sentimentStats} />
+
+            <TrendingTerms
+              selectedSource={selectedSource}
+              selectedCategory={selectedCategory}
+              refreshKey={dataVersion}
+            />
             
             {articles.length === 0 ? (
               <div className="text-center py-12">
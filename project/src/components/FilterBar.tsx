@@ -1,5 +1,6 @@
 import React from 'react';
 import { Filter, Calendar, Globe } from 'lucide-react';
+import { ApiFacetCounts } from '../services/api';
 
 interface FilterBarProps {
   selectedSentiment: string;
@@ -10,6 +11,7 @@ interface FilterBarProps {
   onCategoryChange: (category: string) => void;
   sources: string[];
   categories: string[];
+  facets?: ApiFacetCounts;
 }
 
 export const FilterBar: React.FC<FilterBarProps> = ({
@@ -20,8 +22,20 @@ export const FilterBar: React.FC<FilterBarProps> = ({
   onSourceChange,
   onCategoryChange,
   sources,
-  categories
+  categories,
+  facets = {}
 }) => {
+  // Count for a filter value given the other active filters; 'all' sums the facet
+  const countFor = (facet: keyof ApiFacetCounts, value: string) => {
+    const counts = facets[facet];
+    if (!counts) return undefined;
+    if (value === 'all') return Object.values(counts).reduce((sum, n) => sum + n, 0);
+    return counts[value] ?? 0;
+  };
+
+  const withCount = (label: string, count?: number) =>
+    count === undefined ? label : `${label} (${count})`;
+
   const sentiments = [
     { value: 'all', label: 'All Sentiments', color: 'bg-gray-100 text-gray-700' },
     { value: 'positive', label: 'Positive', color: 'bg-green-100 text-green-700' },
@@ -52,7 +66,7 @@ export const FilterBar: React.FC<FilterBarProps> = ({
                       : 'bg-gray-50 text-gray-600 hover:bg-gray-100'
                   }`}
                 >
-                  {sentiment.label}
+                  {withCount(sentiment.label, countFor('sentiment', sentiment.value))}
                 </button>
               ))}
             </div>
@@ -66,10 +80,10 @@ export const FilterBar: React.FC<FilterBarProps> = ({
               onChange={(e) => onSourceChange(e.target.value)}
               className="text-sm border border-gray-200 rounded-lg px-3 py-1 bg-white focus:outline-none focus:ring-2 focus:ring-blue-500"
             >
-              <option value="all">All Sources</option>
+              <option value="all">{withCount('All Sources', countFor('source', 'all'))}</option>
               {sources.map((source) => (
                 <option key={source} value={source}>
-                  {source}
+                  {withCount(source, countFor('source', source))}
                 </option>
               ))}
             </select>
@@ -83,10 +97,10 @@ export const FilterBar: React.FC<FilterBarProps> = ({
               onChange={(e) => onCategoryChange(e.target.value)}
               className="text-sm border border-gray-200 rounded-lg px-3 py-1 bg-white focus:outline-none focus:ring-2 focus:ring-blue-500"
             >
-              <option value="all">All Categories</option>
+              <option value="all">{withCount('All Categories', countFor('category', 'all'))}</option>
               {categories.map((category) => (
                 <option key={category} value={category}>
-                  {category}
+                  {withCount(category, countFor('category', category))}
                 </option>
               ))}
             </select>
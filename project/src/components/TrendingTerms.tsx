@@ -0,0 +1,87 @@
+import React, { useEffect, useState } from 'react';
+import { Flame } from 'lucide-react';
+import { apiService, ApiTrendingTerm } from '../services/api';
+
+interface TrendingTermsProps {
+  selectedSource: string;
+  selectedCategory: string;
+  // Changes when new articles have been scraped; refetch then rather than on a timer
+  refreshKey: number;
+}
+
+const sentimentColors = {
+  positive: 'bg-green-50 text-green-700 border-green-200',
+  negative: 'bg-red-50 text-red-700 border-red-200',
+  neutral: 'bg-blue-50 text-blue-700 border-blue-200'
+};
+
+export const TrendingTerms: React.FC<TrendingTermsProps> = ({
+  selectedSource,
+  selectedCategory,
+  refreshKey
+}) => {
+  const [timeWindow, setTimeWindow] = useState<'hour' | 'day'>('day');
+  const [terms, setTerms] = useState<ApiTrendingTerm[]>([]);
+
+  useEffect(() => {
+    let cancelled = false;
+
+    const load = async () => {
+      const response = await apiService.getTrending({
+        window: timeWindow,
+        source: selectedSource,
+        category: selectedCategory,
+        limit: 15
+      });
+      if (!cancelled && response.data) {
+        setTerms(response.data.terms);
+      }
+    };
+
+    load();
+    return () => {
+      cancelled = true;
+    };
+  }, [timeWindow, selectedSource, selectedCategory, refreshKey]);
+
+  return (
+    <div className="bg-white/80 backdrop-blur-md rounded-xl border border-gray-200 p-4 mb-6">
+      <div className="flex items-center justify-between mb-3">
+        <div className="flex items-center space-x-2">
+          <Flame className="w-5 h-5 text-orange-500" />
+          <h3 className="text-lg font-semibold text-gray-900">Trending</h3>
+        </div>
+        <div className="flex space-x-1">
+          {(['hour', 'day'] as const).map((option) => (
+            <button
+              key={option}
+              onClick={() => setTimeWindow(option)}
+              className={`px-3 py-1 rounded-lg text-sm transition-all duration-200 ${
+                timeWindow === option ? 'bg-blue-600 text-white' : 'text-gray-600 hover:bg-gray-100'
+              }`}
+            >
+              Last {option}
+            </button>
+          ))}
+        </div>
+      </div>
+
+      {terms.length === 0 ? (
+        <p className="text-sm text-gray-500">Nothing trending yet.</p>
+      ) : (
+        <div className="flex flex-wrap gap-2">
+          {terms.map((term) => (
+            <span
+              key={term.term}
+              title={`Average sentiment ${term.sentiment_score}`}
+              className={`${sentimentColors[term.sentiment]} border rounded-full px-3 py-1 text-sm`}
+            >
+              {term.term}
+              <span className="ml-1 text-xs opacity-70">{term.count}</span>
+            </span>
+          ))}
+        </div>
+      )}
+    </div>
+  );
+};
@@ -1,6 +1,6 @@
-import { useState, useEffect, useMemo } from 'react';
+import { useState, useEffect, useMemo, useRef } from 'react';
 import { NewsArticle, SentimentStats } from '../types/news';
-import { apiService, ApiArticle } from '../services/api';
+import { apiService, ApiArticle, ApiFacetCounts, ApiScrapeStatusEvent, ApiStatsDelta } from '../services/api';
 
 // Transform API article to frontend article format
 const transformApiArticle = (apiArticle: ApiArticle): NewsArticle => ({
@@ -36,12 +36,17 @@ export const useNews = () => {
   const [sources, setSources] = useState<string[]>([]);
   const [categories, setCategories] = useState<string[]>([]);
 
-  // Fetch articles from API
-  const fetchArticles = async () => {
+  const [facets, setFacets] = useState<ApiFacetCounts>({});
+  // Bumped when a scrape finishes or the data is reset, for views that refetch on their own
+  const [dataVersion, setDataVersion] = useState(0);
+  const isFirstLoad = useRef(true);
+
+  // Fetch articles, stats, filter options and facet counts in one request
+  const fetchDashboard = async () => {
     setLoading(true);
     setError(null);
 
-    const response = await apiService.getArticles({
+    const response = await apiService.getDashboard({
       limit: 50,
       sentiment: selectedSentiment !== 'all' ? selectedSentiment : undefined,
       source: selectedSource !== 'all' ? selectedSource : undefined,
@@ -53,83 +58,89 @@ export const useNews = () => {
       setError(response.error);
       setArticles([]);
     } else if (response.data) {
-      const transformedArticles = response.data.map(transformApiArticle);
-      setArticles(transformedArticles);
+      setArticles(response.data.articles.map(transformApiArticle));
+      setSentimentStats(response.data.stats);
+      setSources(response.data.sources);
+      setCategories(response.data.categories);
+      setFacets(response.data.facets);
     }
 
     setLoading(false);
   };
 
-  // Fetch sentiment statistics
-  const fetchSentimentStats = async () => {
-    const response = await apiService.getSentimentStats();
-    if (response.data) {
-      setSentimentStats(response.data);
-    }
-  };
-
-  // Fetch sources and categories
-  const fetchMetadata = async () => {
-    const [sourcesResponse, categoriesResponse] = await Promise.all([
-      apiService.getSources(),
-      apiService.getCategories()
-    ]);
+  // Fetch on load, then refetch when filters change
+  useEffect(() => {
+    const delay = isFirstLoad.current ? 0 : 500; // Debounce API calls after the first load
+    isFirstLoad.current = false;
+    const timeoutId = setTimeout(() => {
+      fetchDashboard();
+    }, delay);
 
-    if (sourcesResponse.data) {
-      setSources(sourcesResponse.data.sources);
-    }
+    return () => clearTimeout(timeoutId);
+  }, [searchQuery, selectedSentiment, selectedSource, selectedCategory]);
 
-    if (categoriesResponse.data) {
-      setCategories(categoriesResponse.data.categories);
-    }
+  // Manual refresh function
+  const refreshData = async () => {
+    await fetchDashboard();
   };
 
-  // Initial data fetch
-  useEffect(() => {
-    fetchArticles();
-    fetchSentimentStats();
-    fetchMetadata();
-  }, []);
+  // Keep the latest search query and fetch (with the current filters) visible to the event stream handlers
+  const searchQueryRef = useRef(searchQuery);
+  searchQueryRef.current = searchQuery;
+  const fetchDashboardRef = useRef(fetchDashboard);
+  fetchDashboardRef.current = fetchDashboard;
 
-  // Refetch articles when filters change
+  // Live updates pushed by the backend instead of polling
   useEffect(() => {
-    const timeoutId = setTimeout(() => {
-      fetchArticles();
-      fetchSentimentStats();
-    }, 500); // Debounce API calls
+    const stream = apiService.openEventStream({
+      sentiment: selectedSentiment !== 'all' ? selectedSentiment : undefined,
+      source: selectedSource !== 'all' ? selectedSource : undefined,
+      category: selectedCategory !== 'all' ? selectedCategory : undefined
+    });
 
-    return () => clearTimeout(timeoutId);
-  }, [searchQuery, selectedSentiment, selectedSource, selectedCategory]);
+    stream.addEventListener('article', (event) => {
+      const article = transformApiArticle(JSON.parse((event as MessageEvent).data));
+      const query = searchQueryRef.current.toLowerCase();
+      if (query && !article.title.toLowerCase().includes(query) &&
+          !article.summary.toLowerCase().includes(query)) {
+        return;
+      }
+      setArticles(prev => [article, ...prev.filter(a => a.id !== article.id)].slice(0, 50));
+    });
 
-  // Auto-refresh data every 5 minutes
-  useEffect(() => {
-    const interval = setInterval(() => {
-      fetchArticles();
-      fetchSentimentStats();
-    }, 300000); // 5 minutes
+    stream.addEventListener('stats', (event) => {
+      const { delta } = JSON.parse((event as MessageEvent).data) as { delta: ApiStatsDelta };
+      setSentimentStats(prev => ({
+        positive: prev.positive + (delta.positive || 0),
+        negative: prev.negative + (delta.negative || 0),
+        neutral: prev.neutral + (delta.neutral || 0),
+        total: prev.total + (delta.total || 0)
+      }));
+    });
 
-    return () => clearInterval(interval);
-  }, [selectedSentiment, selectedSource, selectedCategory, searchQuery]);
+    stream.addEventListener('scrape_status', (event) => {
+      const status = JSON.parse((event as MessageEvent).data) as ApiScrapeStatusEvent;
+      if (status.status === 'completed') {
+        fetchDashboardRef.current();
+        setDataVersion(v => v + 1);
+      }
+    });
 
-  // Manual refresh function
-  const refreshData = async () => {
-    await Promise.all([
-      fetchArticles(),
-      fetchSentimentStats(),
-      fetchMetadata()
-    ]);
-  };
+    // The server could not deliver every event; fall back to a full reload
+    const reload = () => {
+      fetchDashboardRef.current();
+      setDataVersion(v => v + 1);
+    };
+    stream.addEventListener('reset', reload);
+    stream.addEventListener('cleared', reload);
+
+    return () => stream.close();
+  }, [selectedSentiment, selectedSource, selectedCategory]);
 
   // Trigger scraping
   const triggerScraping = async () => {
-    const response = await apiService.triggerScraping();
-    if (response.data) {
-      // Refresh data after a short delay to allow scraping to complete
-      setTimeout(() => {
-        refreshData();
-      }, 5000);
-    }
-    return response;
+    // New articles arrive through the event stream as the scrape saves them
+    return apiService.triggerScraping();
   };
 
   return {
@@ -147,6 +158,8 @@ export const useNews = () => {
     sentimentStats,
     sources,
     categories,
+    facets,
+    dataVersion,
     refreshData,
     triggerScraping
   };
@@ -24,6 +24,44 @@ export interface ApiSentimentStats {
   total: number;
 }
 
+export type ApiFacetCounts = Partial<Record<'sentiment' | 'source' | 'category', Record<string, number>>>;
+
+export interface ApiDashboard {
+  articles: ApiArticle[];
+  stats: ApiSentimentStats;
+  sources: string[];
+  categories: string[];
+  facets: ApiFacetCounts;
+}
+
+export type ApiStatsDelta = Partial<ApiSentimentStats>;
+
+export interface ApiSourceProgress {
+  status: string;
+  articles: number;
+  error?: string;
+}
+
+export interface ApiScrapeStatusEvent {
+  job_id: string;
+  status: string;
+  articles_scraped: number;
+  progress: Record<string, ApiSourceProgress>;
+}
+
+export interface ApiTrendingTerm {
+  term: string;
+  count: number;
+  sentiment_score: number;
+  sentiment: 'positive' | 'negative' | 'neutral';
+}
+
+export interface ApiTrending {
+  window: 'hour' | 'day';
+  since: string;
+  terms: ApiTrendingTerm[];
+}
+
 export interface ApiResponse<T> {
   data?: T;
   error?: string;
@@ -65,6 +103,41 @@ class ApiService {
     return this.fetchWithErrorHandling<ApiArticle[]>(url);
   }
 
+  async getDashboard(params: {
+    limit?: number;
+    sentiment?: string;
+    source?: string;
+    category?: string;
+    search?: string;
+  } = {}): Promise<ApiResponse<ApiDashboard>> {
+    const searchParams = new URLSearchParams();
+
+    Object.entries(params).forEach(([key, value]) => {
+      if (value !== undefined && value !== '') {
+        searchParams.append(key, value.toString());
+      }
+    });
+
+    return this.fetchWithErrorHandling<ApiDashboard>(`${API_BASE_URL}/dashboard?${searchParams.toString()}`);
+  }
+
+  async getTrending(params: {
+    window?: 'hour' | 'day';
+    source?: string;
+    category?: string;
+    limit?: number;
+  } = {}): Promise<ApiResponse<ApiTrending>> {
+    const searchParams = new URLSearchParams();
+
+    Object.entries(params).forEach(([key, value]) => {
+      if (value !== undefined && value !== '') {
+        searchParams.append(key, value.toString());
+      }
+    });
+
+    return this.fetchWithErrorHandling<ApiTrending>(`${API_BASE_URL}/trending?${searchParams.toString()}`);
+  }
+
   async getSentimentStats(): Promise<ApiResponse<ApiSentimentStats>> {
     return this.fetchWithErrorHandling<ApiSentimentStats>(`${API_BASE_URL}/sentiment-stats`);
   }
@@ -77,7 +150,7 @@ class ApiService {
     return this.fetchWithErrorHandling<{ categories: string[] }>(`${API_BASE_URL}/categories`);
   }
 
-  async triggerScraping(): Promise<ApiResponse<{ message: string }>> {
+  async triggerScraping(): Promise<ApiResponse<{ message: string; status: string; job_id: string }>> {
     try {
       const response = await fetch(`${API_BASE_URL}/scrape`, {
         method: 'POST',
@@ -95,12 +168,29 @@ class ApiService {
     }
   }
 
+  openEventStream(params: {
+    sentiment?: string;
+    source?: string;
+    category?: string;
+  } = {}): EventSource {
+    const searchParams = new URLSearchParams();
+
+    Object.entries(params).forEach(([key, value]) => {
+      if (value !== undefined && value !== '') {
+        searchParams.append(key, value.toString());
+      }
+    });
+
+    return new EventSource(`${API_BASE_URL}/stream?${searchParams.toString()}`);
+  }
+
   async getScrapingStatus(): Promise<ApiResponse<{
     last_scrape?: string;
     articles_scraped: number;
     sources_active: number;
     status: string;
     next_scrape?: string;
+    job_id?: string;
   }>> {
     return this.fetchWithErrorHandling(`${API_BASE_URL}/scraping-status`);
   }